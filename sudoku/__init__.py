@@ -0,0 +1,41 @@
+# Sudoku game from scratch: solving and generating algorithms, batch tools and a pygame GUI.
+#
+# Importing the package is kept cheap and free of side effects. The solver core is imported right away, while the parts
+# that need "asyncio", "multiprocessing", "threading", "numpy" or "pygame" are only imported the first time one of their
+# names is used.
+
+from .board import count_masks, init_masks, read_line, write_line
+from .core import Sudoku
+from .dlx import DancingLinks
+from .files import read_games, write_games
+from .general import BoardSearch, Layout, layout
+from .grading import GRADES, grade_board, next_step
+from .hints import HintIndex
+from .moves import MoveTracker
+from .stats import SolveStats
+from .symmetry import SolutionCache, canonical_form, from_canonical, to_canonical
+
+__all__ = [
+    "Sudoku", "DancingLinks", "BoardSearch", "Layout", "layout", "SolveStats", "SolutionCache", "canonical_form",
+    "to_canonical", "from_canonical", "MoveTracker", "HintIndex", "GRADES", "grade_board", "next_step",
+    "count_masks", "init_masks", "read_line", "write_line", "read_games", "write_games", "solve_one", "solve_many",
+    "solve_file", "batch_array", "batch_candidates", "batch_valid", "batch_singles", "solve_batch", "PuzzlePool",
+    "SolverServer", "run_gui",
+]
+
+# Names imported on first use, and the module that defines them.
+LAZY = {
+    "solve_one": "parallel", "solve_many": "parallel", "solve_file": "parallel",
+    "batch_array": "vectorized", "batch_candidates": "vectorized", "batch_valid": "vectorized",
+    "batch_singles": "vectorized", "solve_batch": "vectorized",
+    "PuzzlePool": "pool",
+    "SolverServer": "server",
+    "run_gui": "gui",
+}
+
+
+def __getattr__(name):
+    if name in LAZY:
+        from importlib import import_module
+        return getattr(import_module("." + LAZY[name], __name__), name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,227 @@
+# Command line entry point of the Sudoku package, e.g. "python -m sudoku demo" or "python -m sudoku gui".
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from . import SolutionCache, SolveStats, Sudoku, benchmark, read_line, write_games
+
+# Maximum time in seconds that "import sudoku" may take in a fresh interpreter.
+IMPORT_BUDGET = 0.05
+
+
+def demo():
+    """
+    Run the demo, which tests whether the algorithms work and how long they take.
+    """
+    from . import parallel, vectorized
+
+    sudoku = Sudoku(grid=[[5, 3, 0, 0, 7, 0, 0, 0, 0],
+                          [6, 0, 0, 1, 9, 5, 0, 0, 0],
+                          [0, 9, 8, 0, 0, 0, 0, 6, 0],
+                          [8, 0, 0, 0, 6, 0, 0, 0, 3],
+                          [4, 0, 0, 8, 0, 3, 0, 0, 1],
+                          [7, 0, 0, 0, 2, 0, 0, 0, 6],
+                          [0, 6, 0, 0, 0, 0, 2, 8, 0],
+                          [0, 0, 0, 4, 1, 9, 0, 0, 5],
+                          [0, 0, 0, 0, 8, 0, 0, 7, 9]])
+
+    # Test whether the two solver algorithms work
+    sudoku.solver(method="inorder")
+
+    sudoku.solver(method="sorted")
+
+    sudoku.solver(method="bitmask")
+
+    sudoku.solver(method="propagate")
+
+    sudoku.solver(method="dlx")
+
+    # Show the search statistics of each algorithm on a known hard game
+    stats = SolveStats()
+    for method in benchmark.METHODS:
+        sudoku.solver(array=benchmark.HARD_GAMES["Arto Inkala"], method=method, stats=stats)
+        print(method, stats.as_dict())
+
+    # Test how long each algorithm would take on a small corpus of games of each difficulty, see "python -m sudoku
+    # bench" for the full benchmark
+    benchmark.report(benchmark.run(games=10))
+
+    # Compare the recursive and iterative runs of the same algorithms in terms of time and peak memory allocated
+    tracemalloc.start()
+    for method in ["inorder", "sorted"]:
+        for iterative in [False, True]:
+            tracemalloc.reset_peak()
+            start = time.time()
+            for i in range(100):
+                sudoku.solver(method=method, iterative=iterative)
+            end = time.time()
+            print(method, "iterative" if iterative else "recursive", end - start, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    # Generate sudoku games by difficulty, and check that each of them has a unique solution and the requested grade
+    for difficulty in ["easy", "medium", "hard", "super hard"]:
+        start = time.time()
+        game = sudoku.generator(difficulty=difficulty, random_state=123)
+        end = time.time()
+        print(difficulty, end - start, sudoku.count_solutions(game), sudoku.grade(game))
+
+    # Solve known hard games that are all relabelings and transpositions of each other, without a cache, with a cache of
+    # solutions by canonical form that starts empty, and once more with every game cached, i.e. the cost of a hit. The
+    # times are in milliseconds per game
+    cache = SolutionCache(size=100)
+    games = [[read_line(game)[i * 9:i * 9 + 9] for i in range(9)] for game in benchmark.HARD_GAMES.values()]
+    games = [[[(num + shift) % 9 + 1 if num else 0 for num in row] for row in (zip(*game) if shift % 2 else game)]
+             for shift in range(10) for game in games]
+    for name, use in [("uncached", None), ("cached", cache), ("hit", cache)]:
+        for method in ["sorted", "propagate"]:
+            start = time.perf_counter()
+            for game in games:
+                sudoku.solver(game, method=method, verbose=False, cache=use)
+            end = time.perf_counter()
+            print(name, method, (end - start) / len(games) * 1000)
+    print(cache.stats())
+
+    # Solve a batch of games in the current process and with a pool of worker processes
+    games = [sudoku.generator(difficulty="super hard", random_state=i) for i in range(200)]
+    for workers in [1, 4]:
+        parallel.solve_many(games, method="sorted", workers=workers, random_state=123)
+
+    # Solve a batch of easy and medium games one by one and all at once with numpy
+    for difficulty in ["easy", "medium"]:
+        games = [sudoku.generator(difficulty=difficulty, random_state=i) for i in range(500)]
+        start = time.time()
+        for game in games:
+            sudoku.solver(game, method="propagate")
+        end = time.time()
+        print(difficulty, "one by one", end - start)
+        if vectorized.np is not None:
+            start = time.time()
+            vectorized.solve_batch(games)
+            end = time.time()
+            print(difficulty, "batch", end - start)
+
+    # Stream the same games through files in the 81-character line format
+    with tempfile.TemporaryDirectory() as folder:
+        write_games(os.path.join(folder, "games.txt"), games)
+        parallel.solve_file(os.path.join(folder, "games.txt"), os.path.join(folder, "solutions.txt"))
+
+
+def import_time(budget=IMPORT_BUDGET, repeat=5):
+    """
+    Measure how long "import sudoku" takes in a fresh interpreter, and check that it stays under the budget without
+    importing any of the heavy optional modules.
+
+    :param budget: (optional) Maximum import time in seconds. The default is IMPORT_BUDGET.
+    :param repeat: (optional) Number of fresh interpreters to measure. The best time is kept. The default is 5.
+    :return: True if the import time is under the budget and no heavy module was imported, otherwise False.
+    """
+    code = ("import sys, time; start = time.perf_counter(); import sudoku; end = time.perf_counter(); "
+            "print(end - start, *[m for m in ['multiprocessing', 'numpy', 'pygame'] if m in sys.modules])")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    best, heavy = None, []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True,
+                             check=True).stdout.split()
+        best = float(out[0]) if best is None else min(best, float(out[0]))
+        heavy = out[1:]
+    print("import sudoku: {:.1f} ms (budget {:.1f} ms)".format(best * 1000, budget * 1000))
+    if heavy:
+        print("Heavy modules imported:", ", ".join(heavy))
+    return best <= budget and not heavy
+
+
+def main(argv=None):
+    """
+    Parse the command line and run the requested command.
+
+    :param argv: (optional) Command line arguments. The default is to read them from sys.argv.
+    :return: Exit status of the command.
+    """
+    parser = argparse.ArgumentParser(prog="python -m sudoku", description="Sudoku game from scratch.")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("demo", help="test the algorithms and time them (default)")
+    commands.add_parser("gui", help="play the game")
+    bench = commands.add_parser("bench", help="run the benchmark suite")
+    bench.add_argument("--methods", nargs="+", default=benchmark.METHODS, help="solver methods to time")
+    bench.add_argument("--games", type=int, default=50, help="number of games per difficulty")
+    bench.add_argument("--seed", type=int, default=0, help="random seed of the corpus")
+    bench.add_argument("--sizes", nargs="*", type=int, help="also time these box sizes, e.g. 2 3 4 5 (default if "
+                       "given without values)")
+    bench.add_argument("--size-games", type=int, default=5, help="number of games per box size")
+    bench.add_argument("--output", help="save the results as JSON to this file")
+    bench.add_argument("--baseline", help="compare with the JSON results of an earlier run")
+    bench.add_argument("--tolerance", type=float, default=0.2, help="relative slowdown allowed against the baseline")
+    gui = commands.add_parser("gui-bench", help="time the GUI without a window")
+    gui.add_argument("--clicks", type=int, default=50, help="number of clicks to time")
+    gui.add_argument("--idle", type=float, default=2.0, help="seconds to measure the CPU use while idle")
+    budget = commands.add_parser("import-time", help="check the import time of the package against a budget")
+    budget.add_argument("--budget", type=float, default=IMPORT_BUDGET, help="maximum import time in seconds")
+    server = commands.add_parser("serve", help="run the local solver service")
+    load = commands.add_parser("load-test", help="measure the throughput and latency of the local solver service")
+    for command in [server, load]:
+        command.add_argument("--host", default="127.0.0.1", help="address of the service")
+        command.add_argument("--port", type=int, default=8765, help="port of the service")
+        command.add_argument("--unix", help="path of a Unix socket to use instead of the address and port")
+        command.add_argument("--workers", type=int, help="number of worker processes (default: number of CPUs)")
+        command.add_argument("--cache-size", type=int, default=10000, help="maximum number of cached solutions")
+        command.add_argument("--max-batch", type=int, default=64, help="maximum number of requests in a batch")
+        command.add_argument("--max-delay", type=float, default=0.002, help="seconds to wait to fill a batch")
+    load.add_argument("--start", action="store_true", help="start a service in this process to test")
+    load.add_argument("--requests", type=int, default=2000, help="number of solve requests")
+    load.add_argument("--distinct", type=int, default=200, help="number of distinct games among the requests")
+    load.add_argument("--concurrency", type=int, default=32, help="number of connections sending requests at once")
+    args = parser.parse_args(argv)
+
+    if args.command == "gui":
+        Sudoku().GUI()
+    elif args.command == "bench":
+        sizes = benchmark.SIZES if args.sizes == [] else args.sizes
+        results = benchmark.run(args.methods, args.games, args.seed, sizes, args.size_games)
+        benchmark.report(results)
+        if args.output:
+            benchmark.save(results, args.output)
+        if args.baseline:
+            regressions = benchmark.compare(results, benchmark.load(args.baseline), args.tolerance)
+            for name, old, new in regressions:
+                print("Regression: {} p50 {:.3f} ms -> {:.3f} ms".format(name, old * 1000, new * 1000))
+            return 1 if regressions else 0
+    elif args.command == "gui-bench":
+        results = benchmark.time_gui(args.clicks, args.idle)
+        latency = results["latency"]
+        print("New game drawn: p50 {:.2f} ms, max {:.2f} ms".format(
+            results["new_game"]["p50"] * 1000, results["new_game"]["max"] * 1000))
+        print("Idle CPU: {:.1f}%".format(results["idle_cpu"] * 100))
+        print("Click to screen update: p50 {:.2f} ms, p95 {:.2f} ms, max {:.2f} ms".format(
+            latency["p50"] * 1000, latency["p95"] * 1000, latency["max"] * 1000))
+    elif args.command in ["serve", "load-test"]:
+        import asyncio
+        from . import server
+        options = {"workers": args.workers, "cache_size": args.cache_size, "max_batch": args.max_batch,
+                   "max_delay": args.max_delay}
+        if args.command == "serve":
+            server.serve(args.host, args.port, args.unix, **options)
+            return 0
+        games = server.load_corpus(args.requests, args.distinct)
+        if args.start:
+            server.serve_background(args.host, args.port, args.unix, **options)
+        results = asyncio.run(server.load_test(games, args.host, args.port, args.unix, args.concurrency))
+        latency = results["latency"]
+        print("{} requests in {:.3f} seconds ({:.1f} requests per second), {} failed, {} cached".format(
+            results["requests"], results["seconds"], results["throughput"], results["failed"], results["cached"]))
+        print("Latency: p50 {:.2f} ms, p99 {:.2f} ms, max {:.2f} ms".format(
+            latency["p50"] * 1000, latency["p99"] * 1000, latency["max"] * 1000))
+        print("Server:", results["server"])
+    elif args.command == "import-time":
+        return 0 if import_time(args.budget) else 1
+    else:
+        demo()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+# Benchmark suite of the Sudoku package. It times the solver methods and the generator on a fixed-seed corpus of games,
+# and reports the timing distributions in a machine-readable format, so that runs can be compared over time.
+
+import json
+import os
+import platform
+import threading
+import time
+
+from .core import Sudoku
+from .stats import SolveStats
+from .symmetry import SolutionCache
+
+# Well-known hard games in the 81-character line format, each with a unique solution and graded "super hard".
+HARD_GAMES = {
+    "Arto Inkala": "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    "AI Escargot": "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+    "Platinum Blonde": "000000012000000003002300400001800005060070800000009000008500000900040500470006000",
+    "Golden Nugget": "000000039000001005003050800008090006070002000100400000009080050020000600400700000",
+    "Easter Monster": "100000002090400050006000700050903000000070000000850040700000600030009080002000001",
+}
+
+DIFFICULTIES = ["easy", "medium", "hard", "super hard"]
+
+# "inorder" is left out by default, as it can take minutes on a single hard game.
+METHODS = ["sorted", "bitmask", "propagate", "dlx"]
+
+# Box sizes timed by "python -m sudoku bench --sizes", i.e. 4x4, 9x9, 16x16 and 25x25 boards.
+SIZES = [2, 3, 4, 5]
+
+
+def corpus(games=50, random_state=0):
+    """
+    Generate the fixed-seed corpus of the benchmark. The n-th game of each difficulty is generated with random seed
+    random_state + n, so that the same arguments always give the same corpus.
+
+    :param games: (optional) Number of games per difficulty. The default is 50.
+    :param random_state: (optional) Random seed of the first game. The default is 0.
+    :return: a dictionary from each difficulty, plus "known hard", to its list of games.
+    """
+    sudoku = Sudoku()
+    res = {difficulty: [sudoku.generator(difficulty=difficulty, random_state=random_state + n) for n in range(games)]
+           for difficulty in DIFFICULTIES}
+    res["known hard"] = list(HARD_GAMES.values())
+    return res
+
+
+def summary(values):
+    """
+    Summarise a list of measurements with nearest-rank percentiles.
+
+    :param values: a non-empty list of numbers.
+    :return: a dictionary with the count, mean, p50, p95, p99 and max of the values.
+    """
+    values = sorted(values)
+    n = len(values)
+    return {"count": n, "mean": sum(values) / n, "p50": values[(n - 1) * 50 // 100],
+            "p95": values[(n - 1) * 95 // 100], "p99": values[(n - 1) * 99 // 100], "max": values[-1]}
+
+
+def time_solver(games, method="sorted", random_state=0):
+    """
+    Time the solver on each game once.
+
+    :param games: Sudoku games in any format accepted by Sudoku.solver().
+    :param method: (optional) Solver method to time. The default is "sorted".
+    :param random_state: (optional) a user-defined random seed to generate reproducible results. The default is 0.
+    :return: a dictionary with the summaries of the time in seconds, of the guesses, of the search nodes expanded and of
+        the backtracks, and the number of games solved.
+    """
+    sudoku = Sudoku(random_state=random_state)
+    stats = SolveStats()
+    times, guesses, nodes, backtracks, solved = [], [], [], [], 0
+    for game in games:
+        start = time.perf_counter()
+        res = sudoku.solver(array=game, method=method, verbose=False, stats=stats)
+        end = time.perf_counter()
+        times.append(end - start)
+        guesses.append(res[0][1])
+        nodes.append(stats.nodes)
+        backtracks.append(stats.backtracks)
+        solved += res[0][0]
+    return {"time": summary(times), "guesses": summary(guesses), "nodes": summary(nodes),
+            "backtracks": summary(backtracks), "solved": solved}
+
+
+def time_cache(games, method="propagate", random_state=0):
+    """
+    Time the solver on each game once without a cache, and once more answered from a SolutionCache already holding its
+    solution, so that the cost of a cache hit can be compared with the search it saves.
+
+    :param games: Sudoku games in any format accepted by Sudoku.solver().
+    :param method: (optional) Solver method to time. The default is "propagate".
+    :param random_state: (optional) a user-defined random seed to generate reproducible results. The default is 0.
+    :return: a dictionary with the summaries of the time in seconds of the uncached solves and of the cache hits, and
+        the stats of the cache.
+    """
+    sudoku = Sudoku(random_state=random_state)
+    cache = SolutionCache(size=len(games))
+    solve, hit = [], []
+    for game in games:
+        start = time.perf_counter()
+        sudoku.solver(array=game, method=method, verbose=False)
+        end = time.perf_counter()
+        solve.append(end - start)
+        sudoku.solver(array=game, method=method, verbose=False, cache=cache)
+        start = time.perf_counter()
+        sudoku.solver(array=game, method=method, verbose=False, cache=cache)
+        end = time.perf_counter()
+        hit.append(end - start)
+    return {"solve": summary(solve), "hit": summary(hit), "cache": cache.stats()}
+
+
+def time_generator(difficulty="easy", games=50, random_state=0):
+    """
+    Time the generator, generating each game with its own random seed as in corpus().
+
+    :param difficulty: (optional) Difficulty of the games to generate. The default is "easy".
+    :param games: (optional) Number of games to generate. The default is 50.
+    :param random_state: (optional) Random seed of the first game. The default is 0.
+    :return: a dictionary with the summary of the time in seconds.
+    """
+    sudoku = Sudoku()
+    times = []
+    for n in range(games):
+        start = time.perf_counter()
+        sudoku.generator(difficulty=difficulty, random_state=random_state + n)
+        end = time.perf_counter()
+        times.append(end - start)
+    return {"time": summary(times)}
+
+
+def time_size(box, games=5, random_state=0):
+    """
+    Time the generator and the solver on boards of one box size. Each game is generated as "super hard" with its own
+    random seed as in corpus(), i.e. with as many cells unfilled as possible, and then solved once from a random order.
+    9x9 games are solved with the "propagate" method, which is the closest to the search of the other sizes.
+
+    :param box: Box size of the boards.
+    :param games: (optional) Number of games to generate and solve. The default is 5.
+    :param random_state: (optional) Random seed of the first game. The default is 0.
+    :return: a dictionary with the summaries of the generator time and the solver time in seconds, of the cells to fill
+        and of the search nodes expanded, and the number of games solved.
+    """
+    sudoku = Sudoku(box=box)
+    stats = SolveStats()
+    generate, solve, blanks, nodes, solved = [], [], [], [], 0
+    for n in range(games):
+        start = time.perf_counter()
+        game = sudoku.generator(difficulty="super hard", random_state=random_state + n)
+        end = time.perf_counter()
+        generate.append(end - start)
+        blanks.append(sum(row.count(0) for row in game))
+        start = time.perf_counter()
+        res = sudoku.solver(array=game, method="propagate", random_state=random_state + n, verbose=False, stats=stats)
+        end = time.perf_counter()
+        solve.append(end - start)
+        nodes.append(stats.nodes)
+        solved += res[0][0]
+    return {"generator": summary(generate), "solver": summary(solve), "blanks": summary(blanks),
+            "nodes": summary(nodes), "solved": solved}
+
+
+def time_gui(clicks=50, idle=2.0, random_state=0):
+    """
+    Time the GUI without a window, using the dummy video driver of SDL. A few new easy games are started, and the last
+    one is kept. Then the CPU used while the GUI waits for input is measured, and finally the latency from clicking an
+    empty cell to the update of the screen that shades it.
+
+    :param clicks: (optional) Number of clicks to time. The default is 50.
+    :param idle: (optional) Seconds to measure the CPU use while idle. The default is 2.0.
+    :param random_state: (optional) Random seed of the games. The default is 0.
+    :return: a dictionary with the summary of the time in seconds to draw a new game, the CPU time used per second while
+        idle and the summary of the latency in seconds.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from .gui import run_gui
+    from .pool import PuzzlePool
+
+    pool = PuzzlePool(size=1, difficulties=["easy"], random_state=random_state)
+    pool.fill()
+    rendered = threading.Event()
+    res = {}
+
+    def click(x, y):
+        time.sleep(1 / 30)  # Leave the GUI enough time to go back to waiting, as between two clicks of a player.
+        rendered.clear()
+        start = time.perf_counter()
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1))
+        rendered.wait(1)
+        return time.perf_counter() - start
+
+    def drive():
+        rendered.wait(10)  # The GUI is drawn for the first time.
+        new_game = []
+        for _ in range(10):
+            while not pool.games["easy"]:
+                time.sleep(0.01)  # The background refill of the pool is not part of the timings.
+            grid = pool.games["easy"][-1][0]
+            click(650, 130)  # "New Game"
+            new_game.append(click(150, 520))  # "Easy"
+        res["new_game"] = summary(new_game)
+        while not pool.games["easy"]:
+            time.sleep(0.01)
+        empty = [(i, j) for i in range(9) for j in range(9) if not grid[i][j]]
+        start = time.process_time()
+        time.sleep(idle)
+        res["idle_cpu"] = (time.process_time() - start) / idle
+        cells = [empty[n % len(empty)] for n in range(clicks)]
+        res["latency"] = summary([click(72 + j * 44 + 22, 82 + i * 44 + 22) for i, j in cells])
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    thread = threading.Thread(target=drive)
+    thread.start()
+    run_gui(Sudoku(), pool=pool, on_render=lambda rects: rendered.set())
+    thread.join()
+    return res
+
+
+def run(methods=None, games=50, random_state=0, sizes=None, size_games=5):
+    """
+    Run the whole benchmark: every solver method on every group of the corpus, the cost of a cache hit against the
+    "propagate" method on every group, and the generator on every difficulty.
+    If asked, the generator and the solver are also timed on every board size, to show how the time grows with it.
+
+    :param methods: (optional) Solver methods to time. The default is METHODS.
+    :param games: (optional) Number of games per difficulty. The default is 50.
+    :param random_state: (optional) Random seed of the corpus. The default is 0.
+    :param sizes: (optional) Box sizes to time with time_size(), e.g. SIZES. The default is to time none.
+    :param size_games: (optional) Number of games per box size. The default is 5.
+    :return: a dictionary with the settings of the run and the results, ready to be saved as JSON.
+    """
+    methods = METHODS if methods is None else methods
+    games_by_group = corpus(games, random_state)
+    res = {
+        "settings": {"methods": methods, "games": games, "random_state": random_state,
+                     "python": platform.python_version(), "machine": platform.machine(), "time": time.time()},
+        "solver": {method: {group: time_solver(group_games, method, random_state)
+                            for group, group_games in games_by_group.items()} for method in methods},
+        "generator": {difficulty: time_generator(difficulty, games, random_state) for difficulty in DIFFICULTIES},
+        "cache": {group: time_cache(group_games, "propagate", random_state)
+                  for group, group_games in games_by_group.items()},
+    }
+    if sizes:
+        res["settings"].update(sizes=sizes, size_games=size_games)
+        res["sizes"] = {"{0}x{0}".format(box * box): time_size(box, size_games, random_state) for box in sizes}
+    return res
+
+
+def rows(results):
+    """
+    Flatten the results of run() into one row per timed entry.
+
+    :param results: Output from run().
+    :return: a dictionary from a (part, method, group) name to its time summary.
+    """
+    res = {}
+    for method, groups in results["solver"].items():
+        for group, entry in groups.items():
+            res["solver/{}/{}".format(method, group)] = entry["time"]
+    for difficulty, entry in results["generator"].items():
+        res["generator/{}".format(difficulty)] = entry["time"]
+    for group, entry in results.get("cache", {}).items():
+        res["cache/{}/propagate".format(group)] = entry["solve"]
+        res["cache/{}/hit".format(group)] = entry["hit"]
+    for size, entry in results.get("sizes", {}).items():
+        res["size/{}/generator".format(size)] = entry["generator"]
+        res["size/{}/solver".format(size)] = entry["solver"]
+    return res
+
+
+def report(results):
+    """
+    Print the results of run() as a table, with times in milliseconds.
+
+    :param results: Output from run().
+    """
+    print("{:<40}{:>8}{:>10}{:>10}{:>10}{:>10}".format("", "count", "p50", "p95", "p99", "max"))
+    for name, entry in rows(results).items():
+        print("{:<40}{:>8}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}".format(
+            name, entry["count"], entry["p50"] * 1000, entry["p95"] * 1000, entry["p99"] * 1000, entry["max"] * 1000))
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Compare the results of run() with those of an earlier run, and list the entries whose median time got slower by
+    more than the tolerance.
+
+    :param results: Output from run().
+    :param baseline: Output from an earlier run(), e.g. loaded back from its JSON file.
+    :param tolerance: (optional) Relative slowdown allowed. The default is 0.2, i.e. 20%.
+    :return: a list of (name, baseline p50, current p50) for the regressed entries.
+    """
+    old = rows(baseline)
+    return [(name, old[name]["p50"], entry["p50"]) for name, entry in rows(results).items()
+            if name in old and entry["p50"] > old[name]["p50"] * (1 + tolerance)]
+
+
+def save(results, path):
+    """
+    Save the results of run() as JSON.
+
+    :param results: Output from run().
+    :param path: Path of the file to write.
+    """
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(path):
+    """
+    Load the results of an earlier run() saved by save().
+
+    :param path: Path of the file to read.
+    :return: the results.
+    """
+    with open(path) as f:
+        return json.load(f)
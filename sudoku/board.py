@@ -0,0 +1,121 @@
+# Lookup tables and helpers shared by the bitmask-based parts of the Sudoku package.
+
+# Lookup tables for the "bitmask" and "propagate" solvers. The 81 cells are indexed in row-major order, and digit d is
+# stored as the bit 1 << (d - 1) of a 9-bit candidate mask.
+ROW = [c // 9 for c in range(81)]
+COL = [c % 9 for c in range(81)]
+BOX = [(c // 27) * 3 + (c % 9) // 3 for c in range(81)]
+POPCOUNT = [bin(m).count("1") for m in range(512)]  # Number of candidates in a mask.
+LOWBIT = [(m & -m).bit_length() for m in range(512)]  # Smallest digit in a mask, 0 if the mask is empty.
+DIGITS = [tuple(d + 1 for d in range(9) if m >> d & 1) for m in range(512)]  # All the digits in a mask, ascending.
+
+# The 27 units (9 rows, 9 columns and 9 blocks) and the 20 peers sharing a unit with each cell.
+UNITS = ([[r * 9 + c for c in range(9)] for r in range(9)] + [[r * 9 + c for r in range(9)] for c in range(9)] +
+         [[c for c in range(81) if BOX[c] == b] for b in range(9)])
+PEERS = [sorted(set(UNITS[ROW[c]] + UNITS[9 + COL[c]] + UNITS[18 + BOX[c]]) - {c}) for c in range(81)]
+
+# The 54 intersections of a block with a row or a column, saved as (the 3 shared cells, the other 6 cells of the block,
+# the other 6 cells of the row or column). They drive the locked candidates rule.
+SEGMENTS = [([c for c in line if c in box], [c for c in box if c not in line], [c for c in line if c not in box])
+            for box in UNITS[18:] for line in UNITS[:18] if set(line) & set(box)]
+
+# Value of each byte in the 81-character line format, where "1" to "9" are given numbers and "0" or "." are blanks.
+BYTE_VALUE = [0] * 256
+for d in range(1, 10):
+    BYTE_VALUE[48 + d] = d
+
+
+def read_line(line):
+    """
+    Read a Sudoku game in the 81-character line format into a list of numbers in row-major order.
+
+    :param line: a bytes-like object or a string with at least 81 characters. Only the first 81 are read.
+    :return: a list of 81 numbers, where 0 means a blank cell.
+    """
+    if isinstance(line, str):
+        line = line.encode()
+    return [BYTE_VALUE[b] for b in memoryview(line)[:81]]
+
+
+def write_line(board):
+    """
+    Write a Sudoku game in the 81-character line format.
+
+    :param board: Sudoku grid, either as a list of rows or as 81 numbers in row-major order.
+    :return: a bytes object with 81 characters, where "0" means a blank cell.
+    """
+    if len(board) == 9:
+        board = [num for row in board for num in row]
+    return bytes(48 + num for num in board)
+
+
+def init_masks(board):
+    """
+    Build the bitmask state of a Sudoku game, i.e. the masks of the valid numbers of each row, column and block, where
+    bit d - 1 is set while number d can still be filled, and the row-major indices of the cells to fill.
+
+    :param board: 81 numbers in row-major order, where 0 means a blank cell.
+    :return: a list with the row, column and block masks and the cells to fill, or None if a given number is already
+        used in its row, column or block.
+    """
+    row = [511] * 9
+    col = [511] * 9
+    block = [511] * 9
+    cell = []
+    for c in range(81):
+        num = board[c]
+        if num:
+            bit = 1 << (num - 1)
+            if not row[ROW[c]] & col[COL[c]] & block[BOX[c]] & bit:
+                return None
+            row[ROW[c]] ^= bit
+            col[COL[c]] ^= bit
+            block[BOX[c]] ^= bit
+        else:
+            cell.append(c)
+    return [row, col, block, cell]
+
+
+def count_masks(row, col, block, cell, limit):
+    """
+    Count the solutions of a Sudoku game given by its bitmask state, filling the cell with the fewest candidates first.
+    The state is changed during the search but fully restored before returning, so that the caller can keep updating it.
+
+    :param row: Masks of the valid numbers of each row.
+    :param col: Masks of the valid numbers of each column.
+    :param block: Masks of the valid numbers of each block.
+    :param cell: Row-major indices of the cells to fill.
+    :param limit: Stop once this many solutions are found.
+    :return: Number of solutions found, at most limit.
+    """
+    if not cell:
+        return 1
+    k, fewest = 0, 10
+    for n, c in enumerate(cell):
+        count = POPCOUNT[row[ROW[c]] & col[COL[c]] & block[BOX[c]]]
+        if count < fewest:
+            k, fewest = n, count
+            if count <= 1:
+                break
+    if not fewest:
+        return 0
+
+    c = cell[k]
+    cell[k] = cell[-1]
+    cell.pop()
+    i, j, b = ROW[c], COL[c], BOX[c]
+    pool = row[i] & col[j] & block[b]
+    count = 0
+    while pool and count < limit:
+        bit = pool & -pool
+        pool ^= bit
+        row[i] ^= bit
+        col[j] ^= bit
+        block[b] ^= bit
+        count += count_masks(row, col, block, cell, limit - count)
+        row[i] ^= bit
+        col[j] ^= bit
+        block[b] ^= bit
+    cell.append(c)
+    cell[k], cell[-1] = cell[-1], cell[k]
+    return count
@@ -0,0 +1,721 @@
+# The Sudoku class with the solving and generating algorithms. It does not depend on "pygame", which is only imported
+# once the GUI is started.
+
+from random import Random
+from time import perf_counter
+
+from .board import (
+    BOX, COL, DIGITS, LOWBIT, PEERS, POPCOUNT, ROW, SEGMENTS, UNITS, count_masks, init_masks, read_line, write_line
+)
+from .dlx import DancingLinks
+from .general import BoardSearch, generate, layout
+from .grading import GRADES, grade_board
+
+
+class Sudoku:
+
+    def __init__(self, grid=None, random_state=None, box=3):
+        """
+        Initiate the Sudoku class with optional user-defined Sudoku grid and random seed to enforce reproducibility.
+
+        :param grid: (optional) a user-defined Sudoku grid to solve.
+        :param random_state: (optional) a user-defined random seed to generate reproducible results.
+        :param box: (optional) Box size of the board, e.g. 2 for 4x4, 4 for 16x16 or 5 for 25x25. Boards of any other
+            size than 9x9 are solved and generated with the BoardSearch of general.py. The default is 3, i.e. 9x9.
+        """
+        if random_state is not None:
+            self.seed = random_state
+        else:
+            self.seed = None
+        self.box = box
+        if grid is None:
+            self.grid = [[0] * box * box for _ in range(box * box)]
+        else:
+            self.grid = [row.copy() for row in grid]
+
+    def solver(self, array=None, method="inorder", random_state=None, verbose=True, iterative=False, stats=None,
+               cache=None):
+        """
+        Solve the given Sudoku game with one of the five available methods, i.e. "inorder", "sorted", "bitmask",
+        "propagate" or "dlx". All the cells to be filled will be shuffled. "inorder" means to fill the cells in the
+        order that they are shuffled to be, while "sorted" means to fill the cells such that cells with least possible
+        candidate numbers will be filled first. The idea behind those two algorithms is that obviously, filling the
+        cells with least possibilities first is at least as good as not doing so in terms of performance. Sorting all
+        the cells again at every step would be costly, so "sorted" keeps them in buckets by their number of candidates,
+        and only moves the peers of each filled cell from one bucket to another. "bitmask" follows the same idea as
+        "sorted", but keeps the valid numbers of every row, column and block as 9-bit integers instead of sets, so that
+        looking up and counting the candidates of a cell only costs a few table lookups. "propagate" keeps the
+        candidates of every cell as masks, and before each guess fills all the cells that are forced by the naked
+        singles, hidden singles and locked candidates rules. Its guess count is thus the number of real guesses that
+        were needed. "dlx" solves the game as an exact cover problem with the DancingLinks class, which gives the most
+        predictable run time on games with many or no solutions.
+
+        :param array: (optional) Sudoku grid to solve. If not specified, self.grid will be used. It can also be a game
+            in the 81-character line format, e.g. a line from read_games(), which the "bitmask", "propagate" and "dlx"
+            methods and the iterative mode read directly without building a list of rows.
+        :param method: (optional) Specify the "inorder", "sorted", "bitmask", "propagate" or "dlx" method to use. The
+            default is to use the "inorder" method.
+        :param random_state: (optional) a user-defined random seed to generate reproducible results.
+        :param verbose: (optional) Decide whether to print messages. The default is to print them.
+        :param iterative: (optional) Run the "inorder" or "sorted" method without recursion, using a preallocated stack
+            instead. The output is exactly the same, but much fewer objects are created along the way. The other methods
+            ignore it. The default is to use recursion.
+        :param stats: (optional) a SolveStats object to fill with the search statistics of this solve, i.e. the nodes
+            expanded, backtracks, maximum depth, propagation counts, time spent sorting and wall and CPU time. It is
+            reset first, and its hooks are called along the search. The default is to collect no statistics.
+        :param cache: (optional) a SolutionCache to look the game up in before searching, and to save its solution to
+            after. A game equivalent to a cached one by relabeling, transposing or permuting rows, columns, bands or
+            stacks is answered from the cache without any search, with a guess count of 0 and the cells filled in
+            row-major order. Boards of other sizes than 9x9 ignore it. The default is not to use any cache.
+        :return: a list with 2 components. 1st element is the output from the inside dfs() function. 2nd element is the
+            original Sudoku game before being solved. The solved game is given in the same format as the input.
+        """
+        if stats is not None:
+            stats.start()
+
+        # Boards of other sizes than 9x9 are given as lists of rows, and solved by the propagation and search of
+        # BoardSearch whatever the method, as the lookup tables of the other methods are built for 9x9 only.
+        if self.box != 3:
+            grid = self.grid if array is None else array
+            n = self.box * self.box
+            seed = random_state if random_state is not None else self.seed
+            res = BoardSearch([num for row in grid for num in row], self.box).solve(
+                rng=None if seed is None else Random(seed), stats=stats)[1]
+            if stats is not None:
+                stats.stop()
+            if res is None:
+                if verbose:
+                    print("Not a valid sudoku game!")
+                return [[False, 0, []], grid]
+            board, guess, placed = res
+            return [[True, guess, [[c // n, c % n, board[c]] for c in placed]],
+                    [board[i * n:i * n + n] for i in range(n)]]
+
+        # Every method works on the grid in row-major order, "board", except that "inorder" and "sorted" fill a list of
+        # rows, "grid", when run recursively.
+        flat = isinstance(array, (bytes, bytearray, memoryview, str))
+        if flat:
+            board = read_line(array)
+        else:
+            board = [num for row in (self.grid if array is None else array) for num in row]
+
+        if cache is not None:
+            solution, found = cache.get(board)
+            if solution is not None:
+                if stats is not None:
+                    stats.stop()
+                res = [True, 0, [[c // 9, c % 9, solution[c]] for c in range(81) if not board[c]]]
+                return [res, write_line(solution) if flat else [solution[i * 9:i * 9 + 9] for i in range(9)]]
+
+        # Save the cells to fill, and numbers of guesses needed to make. A guess is counted if all the current cells to
+        # fill have at least two possible valid candidates with no immediate rule violation.
+        cell = []
+        guess = 0
+
+        # "sorted" keeps the cells to fill in buckets by their number of candidates: bit c of buckets[k] is set while
+        # cell c is empty with k candidates, and count[c] is that k (-1 once filled). The next cell to fill is then the
+        # lowest bit of the first non-empty bucket, i.e. the same cell as sorting them all by candidates and position.
+        # Filling a number only moves the peers that lose it down one bucket, which is undone on the way back.
+        count = [-1] * 81
+        buckets = [0] * 10
+
+        if method == "dlx":
+            links = DancingLinks(board)
+            links.stats = stats
+            links.search()
+        elif iterative or method in ["bitmask", "propagate"]:
+            # Trace the valid numbers as masks, where bit d - 1 is set while number d can still be filled. The cells to
+            # fill are saved by their row-major index.
+            masks = init_masks(board)
+            if masks is None:
+                # A given number is already used in its row, column or block.
+                if stats is not None:
+                    stats.stop()
+                if verbose:
+                    print("Not a valid sudoku game!")
+                return [[False, 0, []]] + ([self.grid] if array is None else [array])
+            row, col, block, cell = masks
+
+            # "propagate" additionally saves the candidates of every cell (0 once filled). "trail" records every
+            # candidate mask before it is changed and "placed" records the filled numbers, so that everything done
+            # after a guess can be undone.
+            cand = [0] * 81
+            if method == "propagate":
+                for c in cell:
+                    cand[c] = row[ROW[c]] & col[COL[c]] & block[BOX[c]]
+            trail = []
+            placed = []
+            if method == "sorted":
+                for c in cell:
+                    count[c] = POPCOUNT[row[ROW[c]] & col[COL[c]] & block[BOX[c]]]
+        else:
+            # Trace the valid numbers to fill in terms of rows, columns and blocks. They will be updated whenever a new
+            # cell is filled.
+            grid = [board[i * 9:i * 9 + 9] for i in range(9)]
+            row = [set(range(1, 10)) for i in range(9)]
+            col = [set(range(1, 10)) for i in range(9)]
+            block = [set(range(1, 10)) for i in range(9)]
+
+            # Initiate all the tools involved.
+            for i in range(9):
+                for j in range(9):
+                    if grid[i][j]:
+                        row[i].remove(grid[i][j])
+                        col[j].remove(grid[i][j])
+                        block[(i // 3) * 3 + j // 3].remove(grid[i][j])
+                    else:
+                        cell.append([i, j])
+            if method == "sorted":
+                for i, j in cell:
+                    count[i * 9 + j] = len(row[i] & col[j] & block[(i // 3) * 3 + j // 3])
+
+        # All the shuffling is done by a private random generator, which leaves the global one of the random module
+        # untouched. Thus, several games can be solved at the same time without affecting each other.
+        rng = Random(random_state if random_state is not None else self.seed)
+        if random_state is not None or self.seed is not None:
+            rng.shuffle(cell)
+        empty = len(cell)  # The depth of a node of "bitmask" is empty - len(cell).
+        for c in range(81):
+            if count[c] >= 0:
+                buckets[count[c]] |= 1 << c
+
+        def dfs(method, depth=0):
+            """
+            Define the Sudoku solving algorithms.
+
+            :param method: Either "inorder" or "sorted".
+            :param depth: (optional) Number of cells filled so far. The default is 0.
+            :return: a list with 3 elements. 1st element is whether the Sudoku could be solved. 2nd element is how many
+                guesses were made. 3rd element is what numbers were filled in each cell with their positions listed.
+            """
+            if stats is not None:
+                stats.node(depth)
+            if depth == empty:
+                return [True, 0, []]
+
+            # "inorder" basically means solving the Sudoku by the cell orders originally in "cell".
+            if method == "inorder":
+                i, j = cell.pop()
+
+                # "pool" lists all the valid candidates for the current cell. They are sorted before being shuffled, as
+                # the iteration order of a set is not defined and would otherwise make the shuffle not reproducible.
+                pool = sorted(row[i] & col[j] & block[(i // 3) * 3 + j // 3])
+                rng.shuffle(pool)
+                for num in pool:
+                    grid[i][j] = num
+                    row[i].remove(num)
+                    col[j].remove(num)
+                    block[(i // 3) * 3 + j // 3].remove(num)
+                    res = dfs("inorder", depth + 1)
+                    if res[0]:
+                        return [True, res[1] + (len(pool) != 1), [[i, j, num]] + res[2]]
+                    if stats is not None:
+                        stats.backtrack(depth)
+                    grid[i][j] = 0
+                    row[i].add(num)
+                    col[j].add(num)
+                    block[(i // 3) * 3 + j // 3].add(num)
+                cell.append([i, j])
+
+            # "sorted" basically means solving the Sudoku by filling the cells with least possible candidates first.
+            elif method == "sorted":
+                if stats is not None:
+                    start = perf_counter()
+                k = 0
+                while not buckets[k]:
+                    k += 1
+                c = (buckets[k] & -buckets[k]).bit_length() - 1
+                buckets[k] ^= 1 << c
+                count[c] = -1
+                if stats is not None:
+                    stats.sort_time += perf_counter() - start
+                i, j, b = ROW[c], COL[c], BOX[c]
+
+                # "pool" lists all the valid candidates for the current cell. They are sorted before being shuffled, as
+                # the iteration order of a set is not defined and would otherwise make the shuffle not reproducible.
+                pool = sorted(row[i] & col[j] & block[b])
+                rng.shuffle(pool)
+                for num in pool:
+                    # The empty peers that still have "num" as a candidate lose it.
+                    moved = [p for p in PEERS[c]
+                             if count[p] > 0 and num in row[ROW[p]] and num in col[COL[p]] and num in block[BOX[p]]]
+                    for p in moved:
+                        buckets[count[p]] ^= 1 << p
+                        count[p] -= 1
+                        buckets[count[p]] |= 1 << p
+                    grid[i][j] = num
+                    row[i].remove(num)
+                    col[j].remove(num)
+                    block[b].remove(num)
+                    res = dfs("sorted", depth + 1)
+                    if res[0]:
+                        return [True, res[1] + (len(pool) != 1), [[i, j, num]] + res[2]]
+                    if stats is not None:
+                        stats.backtrack(depth)
+                    grid[i][j] = 0
+                    row[i].add(num)
+                    col[j].add(num)
+                    block[b].add(num)
+                    for p in moved:
+                        buckets[count[p]] ^= 1 << p
+                        count[p] += 1
+                        buckets[count[p]] |= 1 << p
+                buckets[k] |= 1 << c
+                count[c] = k
+            return [False, 0, []]
+
+        def dfs_bitmask():
+            """
+            Define the "bitmask" Sudoku solving algorithm. The cell with the fewest candidates is filled first, and its
+            candidates are tried from the smallest number up. The filled numbers are appended on the way back, so the
+            3rd element of the output is reversed once the search is over.
+
+            :return: a list with 3 elements, same as the output from dfs().
+            """
+            if stats is not None:
+                stats.node(empty - len(cell))
+            if not cell:
+                return [True, 0, []]
+
+            # Find the cell with the fewest candidates, and stop early once a cell with at most one candidate is found.
+            k, fewest = 0, 10
+            for n, c in enumerate(cell):
+                count = POPCOUNT[row[ROW[c]] & col[COL[c]] & block[BOX[c]]]
+                if count < fewest:
+                    k, fewest = n, count
+                    if count <= 1:
+                        break
+            if not fewest:
+                return [False, 0, []]
+
+            c = cell[k]
+            cell[k] = cell[-1]
+            cell.pop()
+            i, j, b = ROW[c], COL[c], BOX[c]
+            pool = row[i] & col[j] & block[b]
+            while pool:
+                num = LOWBIT[pool]
+                bit = 1 << (num - 1)
+                pool ^= bit
+                board[c] = num
+                row[i] ^= bit
+                col[j] ^= bit
+                block[b] ^= bit
+                res = dfs_bitmask()
+                if res[0]:
+                    res[1] += fewest != 1
+                    res[2].append([i, j, num])
+                    return res
+                if stats is not None:
+                    stats.backtrack(empty - len(cell))
+                board[c] = 0
+                row[i] ^= bit
+                col[j] ^= bit
+                block[b] ^= bit
+            cell.append(c)
+            cell[k], cell[-1] = cell[-1], cell[k]
+            return [False, 0, []]
+
+        def assign(c, num):
+            """
+            Fill a number in a cell for the "propagate" method and remove it from the candidates of the cell's peers.
+
+            :param c: Row-major index of the cell.
+            :param num: Number to be filled.
+            :return: False if a peer is left without any candidate, otherwise True.
+            """
+            bit = 1 << (num - 1)
+            board[c] = num
+            trail.append((c, cand[c]))
+            cand[c] = 0
+            placed.append([ROW[c], COL[c], num])
+            for p in PEERS[c]:
+                if cand[p] & bit:
+                    trail.append((p, cand[p]))
+                    cand[p] ^= bit
+                    if not cand[p]:
+                        return False
+            return True
+
+        def undo(mark):
+            """
+            Undo all the changes made by the "propagate" method since the given mark.
+
+            :param mark: a tuple of the lengths of "trail" and "placed" to return to.
+            """
+            while len(trail) > mark[0]:
+                c, mask = trail.pop()
+                cand[c] = mask
+            while len(placed) > mark[1]:
+                i, j, num = placed.pop()
+                board[i * 9 + j] = 0
+
+        def propagate():
+            """
+            Fill the forced cells until none is left. A naked single is a cell with only one candidate, and a hidden
+            single is a number that fits only one cell of a row, column or block. Once no single is left, the locked
+            candidates rule is applied: if a number can only go to the 3 cells that a block shares with a row or column,
+            it is removed from the rest of that row or column, and vice versa.
+
+            :return: False if a rule violation is found, otherwise True.
+            """
+            changed = True
+            while changed:
+                changed = False
+
+                # Naked singles.
+                for c in cell:
+                    mask = cand[c]
+                    if mask and not mask & (mask - 1):
+                        if stats is not None:
+                            stats.naked_singles += 1
+                        if not assign(c, LOWBIT[mask]):
+                            return False
+                        changed = True
+
+                # Hidden singles. "once" and "twice" collect the numbers that fit at least one and two cells of a unit.
+                for unit in UNITS:
+                    once = twice = done = 0
+                    for c in unit:
+                        mask = cand[c]
+                        if mask:
+                            twice |= once & mask
+                            once |= mask
+                        else:
+                            done |= 1 << (board[c] - 1)
+                    if once | done != 511:
+                        return False  # A number fits nowhere in the unit.
+                    hidden = once & ~twice
+                    while hidden:
+                        bit = hidden & -hidden
+                        hidden ^= bit
+                        for c in unit:
+                            if cand[c] & bit:
+                                if stats is not None:
+                                    stats.hidden_singles += 1
+                                if not assign(c, LOWBIT[bit]):
+                                    return False
+                                changed = True
+                                break
+                        else:
+                            return False  # Two hidden singles of the unit are in the same cell.
+                if changed:
+                    continue
+
+                # Locked candidates.
+                for inside, box_rest, line_rest in SEGMENTS:
+                    mask = cand[inside[0]] | cand[inside[1]] | cand[inside[2]]
+                    if not mask:
+                        continue
+                    box_mask = line_mask = 0
+                    for c in box_rest:
+                        box_mask |= cand[c]
+                    for c in line_rest:
+                        line_mask |= cand[c]
+                    for rest, bits in [(line_rest, mask & ~box_mask), (box_rest, mask & ~line_mask)]:
+                        if bits:
+                            for c in rest:
+                                if cand[c] & bits:
+                                    if stats is not None:
+                                        stats.locked_candidates += POPCOUNT[cand[c] & bits]
+                                    trail.append((c, cand[c]))
+                                    cand[c] &= ~bits
+                                    if not cand[c]:
+                                        return False
+                                    changed = True
+            return True
+
+        def dfs_propagate(depth=0):
+            """
+            Define the "propagate" Sudoku solving algorithm. All the forced cells are filled first. Then, a guess is
+            made on the cell with the fewest candidates, and everything done after the guess is undone if it fails.
+
+            :param depth: (optional) Number of guesses made on the way to this node. The default is 0.
+            :return: a list with 3 elements, same as the output from dfs().
+            """
+            if stats is not None:
+                stats.node(depth)
+            if not propagate():
+                return [False, 0, []]
+            c, fewest = None, 10
+            for n in cell:
+                if cand[n] and POPCOUNT[cand[n]] < fewest:
+                    c, fewest = n, POPCOUNT[cand[n]]
+                    if fewest == 2:
+                        break
+            if c is None:
+                return [True, 0, placed]
+
+            # Every cell left has at least two candidates after the propagation, so each guess here is a real one.
+            mark = (len(trail), len(placed))
+            pool = cand[c]
+            while pool:
+                num = LOWBIT[pool]
+                pool &= pool - 1
+                if assign(c, num):
+                    res = dfs_propagate(depth + 1)
+                    if res[0]:
+                        res[1] += 1
+                        return res
+                if stats is not None:
+                    stats.backtrack(depth)
+                undo(mark)
+            return [False, 0, []]
+
+        def dfs_iterative(method):
+            """
+            Run the "inorder" or "sorted" Sudoku solving algorithm with an explicit stack instead of recursion. Every
+            stack level is allocated once and reused, and the filled numbers are only read off the stack once a solution
+            is found. The cells and the candidates are picked and shuffled in exactly the same order as dfs() does, so
+            that both of them give the same output for the same random seed.
+
+            :param method: Either "inorder" or "sorted".
+            :return: a list with 3 elements, same as the output from dfs().
+            """
+            n = len(cell)
+            order = cell[::-1]  # dfs() pops the cells from the end of "cell".
+            pools = [[] for _ in range(n)]  # The shuffled candidates of the cell at each level.
+            tried = [0] * n  # How many candidates have been tried at each level.
+            moved = [[] for _ in range(n)]  # The peers moved down one bucket by the number tried at each level.
+            depth = 0
+            forward = True
+            while depth < n:
+                if forward:
+                    if stats is not None:
+                        stats.node(depth)
+                        start = perf_counter()
+                    if method == "sorted":
+                        # Same choice as in dfs(): fewest candidates first, then the smallest position.
+                        k = 0
+                        while not buckets[k]:
+                            k += 1
+                        c = (buckets[k] & -buckets[k]).bit_length() - 1
+                        buckets[k] ^= 1 << c
+                        count[c] = -1
+                        order[depth] = c
+                        if stats is not None:
+                            stats.sort_time += perf_counter() - start
+                    c = order[depth]
+                    pool = pools[depth]
+                    pool[:] = DIGITS[row[ROW[c]] & col[COL[c]] & block[BOX[c]]]
+                    rng.shuffle(pool)
+                    tried[depth] = 0
+                else:
+                    # Back from a failed level, so remove the number tried at this level.
+                    if stats is not None:
+                        stats.backtrack(depth)
+                    c = order[depth]
+                    pool = pools[depth]
+                    bit = 1 << (pool[tried[depth] - 1] - 1)
+                    board[c] = 0
+                    row[ROW[c]] ^= bit
+                    col[COL[c]] ^= bit
+                    block[BOX[c]] ^= bit
+                    for p in moved[depth]:
+                        buckets[count[p]] ^= 1 << p
+                        count[p] += 1
+                        buckets[count[p]] |= 1 << p
+                if tried[depth] < len(pool):
+                    num = pool[tried[depth]]
+                    tried[depth] += 1
+                    bit = 1 << (num - 1)
+                    if method == "sorted":
+                        # The empty peers that still have "num" as a candidate lose it.
+                        moved[depth] = [p for p in PEERS[c]
+                                        if count[p] > 0 and row[ROW[p]] & col[COL[p]] & block[BOX[p]] & bit]
+                        for p in moved[depth]:
+                            buckets[count[p]] ^= 1 << p
+                            count[p] -= 1
+                            buckets[count[p]] |= 1 << p
+                    board[c] = num
+                    row[ROW[c]] ^= bit
+                    col[COL[c]] ^= bit
+                    block[BOX[c]] ^= bit
+                    depth += 1
+                    forward = True
+                elif depth:
+                    if method == "sorted":
+                        # Every number of this level failed, so put its cell back in its bucket.
+                        count[c] = POPCOUNT[row[ROW[c]] & col[COL[c]] & block[BOX[c]]]
+                        buckets[count[c]] |= 1 << c
+                    depth -= 1
+                    forward = False
+                else:
+                    return [False, 0, []]
+            if stats is not None:
+                stats.node(n)
+            return [True, sum(len(pool) != 1 for pool in pools),
+                    [[ROW[order[d]], COL[order[d]], pools[d][tried[d] - 1]] for d in range(n)]]
+
+        if method == "dlx":
+            res = [bool(links.solution), links.guess, links.solution]
+        elif iterative and method in ["inorder", "sorted"]:
+            res = dfs_iterative(method)
+        elif method == "bitmask":
+            res = dfs_bitmask()
+            res[2].reverse()
+        elif method == "propagate":
+            res = dfs_propagate() if all(cand[c] for c in cell) else [False, 0, []]
+        else:
+            res = dfs(method)
+        if stats is not None:
+            stats.stop()
+        if res[0]:
+            for i, j, num in res[2]:
+                board[i * 9 + j] = num
+            if cache is not None:
+                cache.put(found, board)
+            return [res, write_line(board) if flat else [board[i * 9:i * 9 + 9] for i in range(9)]]
+        if verbose:
+            print("Not a valid sudoku game!")
+        return [res] + ([self.grid] if array is None else [array])
+
+    def count_solutions(self, array=None, limit=2):
+        """
+        Count the solutions of the given Sudoku game, stopping as soon as the limit is reached. With the default limit,
+        this tells whether the solution is unique without searching any further.
+
+        :param array: (optional) Sudoku grid to check. If not specified, self.grid will be used. It can also be a game
+            in the 81-character line format.
+        :param limit: (optional) Stop once this many solutions are found. The default is 2.
+        :return: Number of solutions found, at most limit. 0 means the game is not valid.
+        """
+        if self.box != 3:
+            return BoardSearch([num for row in (self.grid if array is None else array) for num in row],
+                               self.box).solve(limit)[0]
+        if isinstance(array, (bytes, bytearray, memoryview, str)):
+            masks = init_masks(read_line(array))
+        else:
+            masks = init_masks([num for row in (self.grid if array is None else array) for num in row])
+        if masks is None:
+            return 0
+        return count_masks(*masks, limit)
+
+    def grade(self, array=None):
+        """
+        Grade the given Sudoku game by the solving techniques and guesses it needs, see grade_board().
+
+        :param array: (optional) Sudoku grid to grade. If not specified, self.grid will be used. It can also be a game
+            in the 81-character line format.
+        :return: a dictionary with the grade, i.e. "easy", "medium", "hard" or "super hard", how many times each
+            technique was applied and the number of guesses, or None if the game has no solution.
+        """
+        if isinstance(array, (bytes, bytearray, memoryview, str)):
+            return grade_board(read_line(array))
+        return grade_board([num for row in (self.grid if array is None else array) for num in row])
+
+    def generator(self, array=None, difficulty="easy", random_state=None):
+        """
+        Generate a Sudoku game board of the requested grade, see grade_board(). The cells are unfilled one by one in a
+        random order, and a cell is left filled if unfilling it would break the solution uniqueness or make the game
+        harder than requested. The generation stops as soon as the game has the requested grade and at least a minimum
+        number of cells to fill, i.e. 15, 25, 40 and 40 for the 4 grades. If a pass ends before, another one is made
+        with a new order of the cells, and the hardest game found is returned if none of 50 passes reaches the grade.
+
+        :param array: (optional) A completed Sudoku board to start with. If not provided, it will be generated
+            automatically. It can also be given in the 81-character line format.
+        :param difficulty: (optional) "easy", "medium", "hard" or "super hard". Any value other than the first 3 values
+            will be perceived as "super hard". The default is "easy".
+        :param random_state: (optional) a user-defined random seed to generate reproducible results.
+        :return: A list with Sudoku game board to play with, or a line in the 81-character line format if array was
+            given in that format.
+        """
+        if self.box != 3:
+            return self.generator_general(array, difficulty, random_state)
+        flat = isinstance(array, (bytes, bytearray, memoryview, str))
+        if flat:
+            solution = read_line(array)
+        elif array is not None:
+            solution = [num for row in array for num in row]
+        if array is not None and init_masks(solution) is None:
+            print("Not a valid sudoku game!")
+            return array
+        rng = Random(random_state if random_state is not None else self.seed)
+
+        # The requested grade, and the minimum number of cells to fill that corresponds to it.
+        target = GRADES.index(difficulty) if difficulty in GRADES else 3
+        best = None
+
+        # Not every order of the cells reaches the requested grade, so a few passes may be needed. Each pass starts
+        # again from the given board, or from a new completed board if none was given.
+        for _ in range(50):
+            if array is None:
+                grid = self.solver(array=[[0] * 9 for _ in range(9)], method="sorted",
+                                   random_state=rng.getrandbits(32))[1]
+                board = [num for row in grid for num in row]
+            else:
+                board = solution.copy()
+
+            # Trace the valid numbers as masks, same as the "bitmask" solver. They are kept up to date while the cells
+            # are unfilled, so that checking the solution uniqueness never has to rebuild them.
+            row, col, block, empty = init_masks(board)
+            cell = [c for c in range(81) if board[c]]
+            rng.shuffle(cell)
+            bound = [15, 25, 40, 40][target]
+            level = 0
+
+            while cell and (bound > 0 or level < target):
+                c = cell.pop()
+                num = board[c]
+                bit = 1 << (num - 1)
+                row[ROW[c]] ^= bit
+                col[COL[c]] ^= bit
+                block[BOX[c]] ^= bit
+                empty.append(c)
+                board[c] = 0
+
+                # A game solved without any guess has a unique solution. Otherwise, if the game has a second solution
+                # once the current cell is unfilled, it violates the principle of solution uniqueness and the current
+                # cell should not be unfilled. It should not be either if the game would get harder than requested.
+                res = GRADES.index(grade_board(board)["grade"])
+                if res > target or (res == 3 and count_masks(row, col, block, empty, 2) > 1):
+                    row[ROW[c]] ^= bit
+                    col[COL[c]] ^= bit
+                    block[BOX[c]] ^= bit
+                    empty.pop()
+                    board[c] = num
+                else:
+                    level = res
+                    bound -= 1
+
+            if best is None or level > best[0]:
+                best = [level, board]
+            if level == target:
+                break
+        board = best[1]
+        return write_line(board) if flat else [board[i * 9:i * 9 + 9] for i in range(9)]
+
+    def generator_general(self, array=None, difficulty="easy", random_state=None):
+        """
+        Generate a game of any other size than 9x9 with generate() of general.py. grade_board() only grades 9x9 games,
+        so the difficulty sets the share of the cells to unfill instead, i.e. the same shares as the minimum numbers of
+        cells to fill of 9x9 games for "easy", "medium" and "hard", and as many cells as possible for "super hard".
+        Every game can be solved by the naked singles and hidden singles rules alone, thus its solution is unique.
+
+        :param array: (optional) A completed board to start with, as a list of rows. If not provided, it will be
+            generated automatically.
+        :param difficulty: (optional) "easy", "medium", "hard" or "super hard". Any value other than the first 3 values
+            will be perceived as "super hard". The default is "easy".
+        :param random_state: (optional) a user-defined random seed to generate reproducible results.
+        :return: A list with the game board to play with.
+        """
+        lay = layout(self.box)
+        n = lay.size
+        solution = None
+        if array is not None:
+            solution = [num for row in array for num in row]
+            if not BoardSearch(solution, self.box).valid or not all(solution):
+                print("Not a valid sudoku game!")
+                return array
+        target = GRADES.index(difficulty) if difficulty in GRADES else 3
+        bound = None if target == 3 else lay.cells * [15, 25, 40][target] // 81
+        board = generate(self.box, bound, Random(random_state if random_state is not None else self.seed), solution)
+        return [board[i * n:i * n + n] for i in range(n)]
+
+    def GUI(self):
+        """
+        Generate a Sudoku GUI with some simple functionalities enabled. "pygame" is imported here, so that it is only
+        needed to play the game.
+        """
+        from .gui import run_gui
+        run_gui(self)
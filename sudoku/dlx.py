@@ -0,0 +1,162 @@
+# Exact cover formulation of Sudoku solved with dancing links, used by the "dlx" solver method.
+
+from .board import BOX, COL, LOWBIT, ROW, init_masks
+
+
+class DancingLinks:
+
+    def __init__(self, board):
+        """
+        Formulate a Sudoku game as an exact cover problem and store it with the dancing links data structure. Each of
+        the 324 columns is a constraint, i.e. a cell is filled, or a number appears in a row, a column or a block. Each
+        row is a candidate number in an empty cell, which satisfies exactly 4 constraints. The constraints already met
+        by the given numbers are left out, and so are the candidates that violate them. All the links are saved in flat
+        integer lists, where node 0 is the root and nodes 1 to 324 are the column headers.
+
+        :param board: Sudoku grid to solve, as 81 numbers in row-major order.
+        """
+        self.L = list(range(-1, 324))
+        self.R = list(range(1, 326))
+        self.L[0], self.R[324] = 324, 0
+        self.U = list(range(325))
+        self.D = list(range(325))
+        self.C = list(range(325))  # Column header of each node.
+        self.S = [0] * 325  # Number of nodes in each column.
+        self.N = [0] * 325  # Candidate of each node saved as 9 * cell + number - 1.
+        self.valid = True
+        self.solution = []
+        self.guess = 0
+        self.stack = []
+        self.stats = None  # An optional SolveStats object filled by search().
+
+        masks = init_masks(board)
+        if masks is None:
+            self.valid = False
+            return
+        row, col, block, cell = masks
+        for c in range(81):
+            if board[c]:
+                for h in self.columns(c, board[c] - 1):
+                    self.L[self.R[h]] = self.L[h]
+                    self.R[self.L[h]] = self.R[h]
+            else:
+                pool = row[ROW[c]] & col[COL[c]] & block[BOX[c]]
+                while pool:
+                    d = LOWBIT[pool] - 1
+                    pool &= pool - 1
+                    first = len(self.C)
+                    for h in self.columns(c, d):
+                        x = len(self.C)
+                        self.C.append(h)
+                        self.N.append(9 * c + d)
+                        self.U.append(self.U[h])
+                        self.D.append(h)
+                        self.D[self.U[h]] = x
+                        self.U[h] = x
+                        self.L.append(x - 1)
+                        self.R.append(x + 1)
+                        self.S[h] += 1
+                    self.L[first], self.R[-1] = len(self.C) - 1, first
+
+    @staticmethod
+    def columns(c, d):
+        """
+        List the 4 column headers satisfied by filling a number in a cell.
+
+        :param c: Row-major index of the cell.
+        :param d: Number to be filled minus 1.
+        :return: a list of 4 column headers.
+        """
+        return [1 + c, 82 + ROW[c] * 9 + d, 163 + COL[c] * 9 + d, 244 + BOX[c] * 9 + d]
+
+    def cover(self, h):
+        """
+        Remove a column, and all the rows that have a node in it, from the data structure.
+
+        :param h: Column header.
+        """
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        L[R[h]] = L[h]
+        R[L[h]] = R[h]
+        i = D[h]
+        while i != h:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, h):
+        """
+        Put back a column removed by cover(), undoing the steps in exactly the reverse order.
+
+        :param h: Column header.
+        """
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[h]
+        while i != h:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        L[R[h]] = h
+        R[L[h]] = h
+
+    def search(self, limit=1):
+        """
+        Apply Knuth's Algorithm X, always branching on the column with the fewest nodes. The numbers filled for the
+        first solution found are saved in self.solution, in the same format as the solver, and the number of guesses
+        made on its way in self.guess.
+
+        :param limit: (optional) Stop once this many solutions are found. The default is to stop at the first one.
+        :return: Number of solutions found, at most limit.
+        """
+        if not self.valid:
+            return 0
+        stats = self.stats
+        if stats is not None:
+            stats.node(len(self.stack))
+        R, D, S = self.R, self.D, self.S
+        if R[0] == 0:
+            if not self.solution:
+                self.solution = [[ROW[n // 9], COL[n // 9], n % 9 + 1] for n, _ in self.stack]
+                self.guess = sum(size != 1 for _, size in self.stack)
+            return 1
+
+        h, fewest = 0, 10
+        j = R[0]
+        while j:
+            if S[j] < fewest:
+                h, fewest = j, S[j]
+                if fewest <= 1:
+                    break
+            j = R[j]
+        if not fewest:
+            return 0
+
+        count = 0
+        self.cover(h)
+        i = D[h]
+        while i != h and count < limit:
+            self.stack.append((self.N[i], fewest))
+            j = R[i]
+            while j != i:
+                self.cover(self.C[j])
+                j = R[j]
+            found = self.search(limit - count)
+            count += found
+            j = self.L[i]
+            while j != i:
+                self.uncover(self.C[j])
+                j = self.L[j]
+            if stats is not None and not found:
+                stats.backtrack(len(self.stack))
+            self.stack.pop()
+            i = D[i]
+        self.uncover(h)
+        return count
@@ -0,0 +1,53 @@
+# Reading and writing Sudoku games in the 81-character line format, one game per line.
+
+import mmap
+import os
+
+from .board import write_line
+
+
+def read_games(path):
+    """
+    Read Sudoku games lazily from a file with one game per line in the 81-character line format. The file is memory
+    mapped, so that only the lines being read are loaded. Empty lines and lines starting with "#" are skipped, and any
+    text after the first 81 characters of a line is ignored.
+
+    :param path: Path of the file to read.
+    :return: a generator of the games, each as a bytes object with 81 characters.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, size, n = 0, len(mm), 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end < 0:
+                    end = size
+                n += 1
+                if end > start and mm[start] != ord("#") and mm[start:end].strip():
+                    if end - start < 81:
+                        raise ValueError("Line {} of {} is not a Sudoku game".format(n, path))
+                    yield mm[start:start + 81]
+                start = end + 1
+
+
+def write_games(path, games):
+    """
+    Write Sudoku games to a file with one game per line in the 81-character line format, one at a time as they come.
+
+    :param path: Path of the file to write.
+    :param games: Sudoku grids to write, either as lists of rows or in the 81-character line format. Any iterable works,
+        and it is consumed lazily.
+    :return: Number of games written.
+    """
+    n = 0
+    with open(path, "wb") as f:
+        for game in games:
+            if isinstance(game, str):
+                f.write(game[:81].encode())
+            else:
+                f.write(bytes(game[:81]) if isinstance(game, (bytes, bytearray, memoryview)) else write_line(game))
+            f.write(b"\n")
+            n += 1
+    return n
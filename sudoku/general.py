@@ -0,0 +1,301 @@
+# Sudoku boards of any box size, e.g. 4x4 (box size 2), 16x16 (box size 4) or 25x25 (box size 5). The lookup tables of
+# board.py are built here for each box size, and the candidates of a cell are kept as an N-bit integer, so that
+# checking or updating a cell costs the same few integer operations whatever the size of the board.
+
+from random import Random
+
+# The tables of each box size, built the first time they are needed.
+LAYOUTS = {}
+
+
+class Layout:
+
+    def __init__(self, box):
+        """
+        Build the lookup tables of a board, same as ROW, COL, BOX, UNITS and PEERS in board.py for the 9x9 board.
+
+        :param box: Box size, i.e. the board has box * box rows, columns and blocks.
+        """
+        n = box * box
+        self.box = box
+        self.size = n  # Number of rows, columns, blocks and numbers.
+        self.cells = n * n
+        self.full = (1 << n) - 1  # Mask of all the numbers.
+        self.row = [c // n for c in range(n * n)]
+        self.col = [c % n for c in range(n * n)]
+        self.block = [(c // (n * box)) * box + (c % n) // box for c in range(n * n)]
+        self.units = ([[r * n + c for c in range(n)] for r in range(n)] +
+                      [[r * n + c for r in range(n)] for c in range(n)] +
+                      [[c for c in range(n * n) if self.block[c] == b] for b in range(n)])
+        self.peers = [sorted(set(self.units[self.row[c]] + self.units[n + self.col[c]] +
+                                 self.units[2 * n + self.block[c]]) - {c}) for c in range(n * n)]
+
+
+def layout(box):
+    """
+    :param box: Box size.
+    :return: the Layout of the box size, built once.
+    """
+    if box not in LAYOUTS:
+        LAYOUTS[box] = Layout(box)
+    return LAYOUTS[box]
+
+
+class BoardSearch:
+
+    def __init__(self, board, box):
+        """
+        Set up the candidates of every cell of a board, for the same propagation and search as the "propagate" method
+        of Sudoku.solver(), with the naked singles and hidden singles rules.
+
+        :param board: The numbers of the board in row-major order, where 0 means a blank cell.
+        :param box: Box size of the board.
+        """
+        lay = self.layout = layout(box)
+        self.board = list(board)
+        self.cand = [0] * lay.cells
+        self.cell = []  # The cells to fill.
+        self.trail = []  # Every candidate mask before it is changed, to undo the changes after a failed guess.
+        self.placed = []  # Every cell filled, in order.
+        self.valid = len(self.board) == lay.cells
+        if not self.valid:
+            return
+        used = [0] * (3 * lay.size)  # Numbers used in each row, column and block.
+        n = lay.size
+        for c, num in enumerate(self.board):
+            if num:
+                bit = 1 << (num - 1)
+                units = (lay.row[c], n + lay.col[c], 2 * n + lay.block[c])
+                if not 0 < num <= n or any(used[u] & bit for u in units):
+                    self.valid = False
+                    return
+                for u in units:
+                    used[u] |= bit
+            else:
+                self.cell.append(c)
+        for c in self.cell:
+            self.cand[c] = lay.full & ~(used[lay.row[c]] | used[n + lay.col[c]] | used[2 * n + lay.block[c]])
+
+    def assign(self, c, bit):
+        """
+        Fill a number in a cell and remove it from the candidates of the cell's peers.
+
+        :param c: Row-major index of the cell.
+        :param bit: Mask of the number to be filled.
+        :return: False if a peer is left without any candidate, otherwise True.
+        """
+        cand, trail = self.cand, self.trail
+        self.board[c] = bit.bit_length()
+        trail.append((c, cand[c]))
+        cand[c] = 0
+        self.placed.append(c)
+        for p in self.layout.peers[c]:
+            if cand[p] & bit:
+                trail.append((p, cand[p]))
+                cand[p] ^= bit
+                if not cand[p]:
+                    return False
+        return True
+
+    def undo(self, mark):
+        """
+        Undo all the changes since the given mark.
+
+        :param mark: a tuple of the lengths of self.trail and self.placed to return to.
+        """
+        cand, trail, placed = self.cand, self.trail, self.placed
+        while len(trail) > mark[0]:
+            c, mask = trail.pop()
+            cand[c] = mask
+        while len(placed) > mark[1]:
+            self.board[placed.pop()] = 0
+
+    def propagate(self):
+        """
+        Fill the naked singles and hidden singles until none is left.
+
+        :return: False if a rule violation is found, otherwise True.
+        """
+        cand, board, full = self.cand, self.board, self.layout.full
+        changed = True
+        while changed:
+            changed = False
+            for c in self.cell:
+                mask = cand[c]
+                if mask and not mask & (mask - 1):
+                    if not self.assign(c, mask):
+                        return False
+                    changed = True
+            for unit in self.layout.units:
+                once = twice = done = 0
+                for c in unit:
+                    mask = cand[c]
+                    if mask:
+                        twice |= once & mask
+                        once |= mask
+                    elif board[c]:
+                        done |= 1 << (board[c] - 1)
+                if once | done != full:
+                    return False  # A number fits nowhere in the unit.
+                hidden = once & ~twice
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for c in unit:
+                        if cand[c] & bit:
+                            if not self.assign(c, bit):
+                                return False
+                            changed = True
+                            break
+                    else:
+                        return False  # Two hidden singles of the unit are in the same cell.
+        return True
+
+    def deduce(self):
+        """
+        Fill the board as far as the rules go, without any guess.
+
+        :return: True if the whole board could be filled, which means that its solution is unique, otherwise False.
+        """
+        return self.valid and self.propagate() and len(self.placed) == len(self.cell)
+
+    def solve(self, limit=1, rng=None, stats=None):
+        """
+        Search the solutions, guessing on the cell with the fewest candidates whenever the rules are not enough.
+
+        :param limit: (optional) Stop once this many solutions are found. The default is to stop at the first one.
+        :param rng: (optional) a random.Random object to shuffle the candidates of each guess with. The default is to
+            try them from the smallest number up.
+        :param stats: (optional) a SolveStats object to fill, as for Sudoku.solver().
+        :return: a list with 2 components. 1st element is the number of solutions found, at most limit. 2nd element is
+            the first solution found as a list with the filled board, the number of guesses made on its way and the
+            filled cells in order, or None if no solution was found.
+        """
+        first = []
+        cand, cell, trail, placed = self.cand, self.cell, self.trail, self.placed
+
+        def dfs(depth, limit):
+            """
+            Fill the forced cells, then guess on the cell with the fewest candidates and search each of its numbers in
+            turn. Everything done after a guess is undone before the next one, and the first solution found is saved.
+
+            :param depth: Number of guesses made on the way to this node.
+            :param limit: Number of solutions still wanted, i.e. the search under this node stops once it has found
+                that many, so that the whole search never finds more than the limit given to solve().
+            :return: Number of solutions found under this node, at most limit.
+            """
+            if stats is not None:
+                stats.node(depth)
+            if not self.propagate():
+                return 0
+
+            # Guess on the cell with the fewest candidates, or stop if the board is filled.
+            c, fewest = None, self.layout.size + 1
+            for n in cell:
+                if cand[n]:
+                    k = bin(cand[n]).count("1")
+                    if k < fewest:
+                        c, fewest = n, k
+                        if k == 2:
+                            break
+            if c is None:
+                if not first:
+                    first.extend([self.board.copy(), depth, placed.copy()])
+                return 1
+            pool = []
+            mask = cand[c]
+            while mask:
+                pool.append(mask & -mask)
+                mask &= mask - 1
+            if rng is not None:
+                rng.shuffle(pool)
+            mark = (len(trail), len(placed))
+            found = 0
+            for bit in pool:
+                if self.assign(c, bit):
+                    found += dfs(depth + 1, limit - found)
+                self.undo(mark)
+                if found >= limit:
+                    break
+                if stats is not None:
+                    stats.backtrack(depth)
+            return found
+
+        count = dfs(0, limit) if self.valid and all(cand[c] for c in cell) else 0
+        return [count, first or None]
+
+
+def generate(box, bound=None, rng=None, solution=None):
+    """
+    Generate a game of any box size. The cells of a completed board are unfilled in a random order, and a cell is left
+    filled if the naked singles and hidden singles rules would no longer be enough to fill the board again. A board
+    filled by these rules alone has a unique solution, so this never needs to count the solutions, which stops scaling
+    long before 25x25. Most cells are checked at once: if the cell just unfilled can only take back its own number, the
+    rules fill it first and the board stays as easy as it was.
+
+    :param box: Box size.
+    :param bound: (optional) Maximum number of cells to unfill. The default is to unfill as many as possible.
+    :param rng: (optional) a random.Random object. The default is a new one with a random seed.
+    :param solution: (optional) A completed board to start with, in row-major order. If not provided, it will be
+        generated from random blocks on the diagonal.
+    :return: The game in row-major order, where 0 means a blank cell.
+    """
+    if rng is None:
+        rng = Random()
+    lay = layout(box)
+    n = lay.size
+    if solution is None:
+        # The blocks on the diagonal do not share any row or column, so each can be filled at random. They can almost
+        # always be completed, except on small boards, where they are simply drawn again.
+        res = None
+        while res is None:
+            board = [0] * lay.cells
+            for b in range(box):
+                nums = list(range(1, n + 1))
+                rng.shuffle(nums)
+                for c, num in zip(lay.units[2 * n + b * box + b], nums):
+                    board[c] = num
+            res = BoardSearch(board, box).solve(rng=rng)[1]
+        board = res[0]
+    else:
+        board = list(solution)
+
+    # Numbers used in each row, column and block, kept up to date while the cells are unfilled.
+    used = [lay.full] * (3 * n)
+    cell = list(range(lay.cells))
+    rng.shuffle(cell)
+    if bound is None:
+        bound = lay.cells
+
+    def hidden(c, bit):
+        """
+        :param c: Row-major index of the cell just unfilled.
+        :param bit: Mask of its number.
+        :return: True if no other blank cell of one of its row, column or block can take the number, otherwise False.
+        """
+        for unit in (lay.units[lay.row[c]], lay.units[n + lay.col[c]], lay.units[2 * n + lay.block[c]]):
+            for p in unit:
+                if p != c and not board[p] and not (used[lay.row[p]] | used[n + lay.col[p]] |
+                                                    used[2 * n + lay.block[p]]) & bit:
+                    break
+            else:
+                return True
+        return False
+
+    for c in cell:
+        if not bound:
+            break
+        num = board[c]
+        bit = 1 << (num - 1)
+        units = (lay.row[c], n + lay.col[c], 2 * n + lay.block[c])
+        board[c] = 0
+        for u in units:
+            used[u] ^= bit
+        if used[units[0]] | used[units[1]] | used[units[2]] == lay.full ^ bit or hidden(c, bit) or \
+                BoardSearch(board, box).deduce():
+            bound -= 1
+        else:
+            board[c] = num
+            for u in units:
+                used[u] ^= bit
+    return board
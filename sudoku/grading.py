@@ -0,0 +1,182 @@
+# Difficulty grading of Sudoku games by the solving techniques a human player needs, from the simplest one up, and by
+# the guesses left once no technique applies any more.
+
+from .board import BOX, COL, LOWBIT, PEERS, POPCOUNT, ROW, SEGMENTS, UNITS, init_masks
+from .dlx import DancingLinks
+
+# The grades from the easiest up. A game is "easy" if hidden singles are enough to solve it, "medium" if it also needs
+# naked singles, "hard" if it also needs locked candidates, and "super hard" if a guess has to be made.
+GRADES = ["easy", "medium", "hard", "super hard"]
+
+
+def grade_board(board):
+    """
+    Grade a Sudoku game by solving it like a human player would: at each step, the simplest technique that makes
+    progress is applied, i.e. hidden singles, then naked singles, then locked candidates. The grade is given by the
+    hardest technique that was needed. Once no technique applies, the rest of the game is solved with the DancingLinks
+    class, and its guesses are counted. A game solved without any guess has a unique solution.
+
+    :param board: a list of 81 numbers in row-major order, where 0 means a blank cell. It is left unchanged.
+    :return: a dictionary with the grade, how many times each technique was applied and the number of guesses, or None
+        if the game has no solution.
+    """
+    masks = init_masks(board)
+    if masks is None:
+        return None
+    row, col, block, cell = masks
+    board = board.copy()
+    cand = [0] * 81
+    for c in cell:
+        cand[c] = row[ROW[c]] & col[COL[c]] & block[BOX[c]]
+    counts = [0, 0, 0]  # Cells filled by hidden singles, cells filled by naked singles, candidates locked out.
+    level = 0
+    left = len(cell)
+
+    def place(c, bit):
+        """
+        Fill a cell and remove the number from the candidates of its peers.
+
+        :param c: Row-major index of the cell.
+        :param bit: Mask of the number to be filled.
+        :return: False if a peer is left without any candidate, otherwise True.
+        """
+        board[c] = LOWBIT[bit]
+        cand[c] = 0
+        for p in PEERS[c]:
+            if cand[p] & bit:
+                cand[p] ^= bit
+                if not cand[p]:
+                    return False
+        return True
+
+    while left:
+        # Hidden singles.
+        found = 0
+        for unit in UNITS:
+            once = twice = 0
+            for c in unit:
+                twice |= once & cand[c]
+                once |= cand[c]
+            hidden = once & ~twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for c in unit:
+                    if cand[c] & bit:
+                        break
+                else:
+                    return None  # Two hidden singles of the unit are in the same cell.
+                if not place(c, bit):
+                    return None
+                found += 1
+        if found:
+            counts[0] += found
+            left -= found
+            continue
+
+        # Naked singles.
+        for c in cell:
+            mask = cand[c]
+            if mask and not mask & (mask - 1):
+                if not place(c, mask):
+                    return None
+                found += 1
+        if found:
+            counts[1] += found
+            left -= found
+            level = max(level, 1)
+            continue
+
+        # Locked candidates.
+        for inside, box_rest, line_rest in SEGMENTS:
+            mask = cand[inside[0]] | cand[inside[1]] | cand[inside[2]]
+            if not mask:
+                continue
+            box_mask = line_mask = 0
+            for c in box_rest:
+                box_mask |= cand[c]
+            for c in line_rest:
+                line_mask |= cand[c]
+            for rest, bits in [(line_rest, mask & ~box_mask), (box_rest, mask & ~line_mask)]:
+                if bits:
+                    for c in rest:
+                        if cand[c] & bits:
+                            found += POPCOUNT[cand[c] & bits]
+                            cand[c] &= ~bits
+                            if not cand[c]:
+                                return None
+        if found:
+            counts[2] += found
+            level = 2
+            continue
+        break
+
+    guess = 0
+    if left:
+        links = DancingLinks(board)
+        if not links.search():
+            return None
+        guess = links.guess
+        level = 3
+    return {"grade": GRADES[level], "hidden singles": counts[0], "naked singles": counts[1],
+            "locked candidates": counts[2], "guesses": guess}
+
+
+def next_step(board):
+    """
+    Find the next number to fill with the simplest technique, in the same order as grade_board(). Locked candidates
+    only remove candidates, so they are reported when a single only shows up after them.
+
+    :param board: a list of 81 numbers in row-major order, where 0 means a blank cell. It is left unchanged.
+    :return: a list with the row-major index of the cell, the number and the technique, i.e. "hidden single", "naked
+        single" or "locked candidates", or None if none of them applies.
+    """
+    masks = init_masks(board)
+    if masks is None:
+        return None
+    row, col, block, cell = masks
+    cand = [0] * 81
+    for c in cell:
+        cand[c] = row[ROW[c]] & col[COL[c]] & block[BOX[c]]
+    technique = None
+
+    while True:
+        # Hidden singles.
+        for unit in UNITS:
+            once = twice = 0
+            for c in unit:
+                twice |= once & cand[c]
+                once |= cand[c]
+            hidden = once & ~twice
+            if hidden:
+                bit = hidden & -hidden
+                for c in unit:
+                    if cand[c] & bit:
+                        return [c, LOWBIT[bit], technique or "hidden single"]
+
+        # Naked singles.
+        for c in cell:
+            mask = cand[c]
+            if mask and not mask & (mask - 1):
+                return [c, LOWBIT[mask], technique or "naked single"]
+
+        # Locked candidates.
+        changed = False
+        for inside, box_rest, line_rest in SEGMENTS:
+            mask = cand[inside[0]] | cand[inside[1]] | cand[inside[2]]
+            if not mask:
+                continue
+            box_mask = line_mask = 0
+            for c in box_rest:
+                box_mask |= cand[c]
+            for c in line_rest:
+                line_mask |= cand[c]
+            for rest, bits in [(line_rest, mask & ~box_mask), (box_rest, mask & ~line_mask)]:
+                if bits:
+                    for c in rest:
+                        if cand[c] & bits:
+                            cand[c] &= ~bits
+                            changed = True
+        if not changed:
+            return None
+        technique = "locked candidates"
@@ -0,0 +1,415 @@
+# The Sudoku GUI. "pygame" is heavily involved here, and this module is only imported once the GUI is started.
+
+import os
+
+import pygame
+from pygame.locals import (
+    K_ESCAPE, KEYDOWN, QUIT, K_1, K_2, K_3, K_4, K_5, K_6, K_7, K_8, K_9, K_KP1, K_KP2, K_KP3, K_KP4,
+    K_KP5, K_KP6, K_KP7, K_KP8, K_KP9, K_DELETE, MOUSEBUTTONDOWN, VIDEOEXPOSE
+)
+
+
+# File where the games generated in advance are kept between sessions.
+POOL_PATH = os.path.join(os.path.expanduser("~"), ".sudoku_pool.json")
+
+# Maximum number of frames drawn per second.
+FRAME_RATE = 60
+
+
+def run_gui(sudoku, pool=None, on_render=None):
+    """
+    Generate a Sudoku GUI with some simple functionalities enabled.
+
+    :param sudoku: a Sudoku object, whose random seed is used to generate the games.
+    :param pool: (optional) a PuzzlePool to take the new games from. The default is a pool saved in POOL_PATH, which is
+        refilled in the background while the game is played.
+    :param on_render: (optional) a function called as on_render(rects) every time the rectangles of the screen listed
+        in rects have been updated, e.g. to measure the latency of the GUI.
+    """
+    from .board import PEERS
+    from .hints import HintIndex
+    from .moves import MoveTracker
+    from .pool import PuzzlePool
+
+    if pool is None:
+        pool = PuzzlePool(difficulties=["easy", "medium", "hard"], path=POOL_PATH, random_state=sudoku.seed)
+    pool.start()
+
+    # Set up the Sudoku game display and build the key-number HashMap.
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    screen.fill((255, 255, 255))
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([QUIT, KEYDOWN, MOUSEBUTTONDOWN, VIDEOEXPOSE])  # Mouse moves do not wake the loop up.
+    dirty = []  # Rectangles of the screen changed since the last frame.
+    running = True
+    keys = {K_1: 1, K_2: 2, K_3: 3, K_4: 4, K_5: 5, K_6: 6, K_7: 7, K_8: 8, K_9: 9,
+            K_KP1: 1, K_KP2: 2, K_KP3: 3, K_KP4: 4, K_KP5: 5, K_KP6: 6, K_KP7: 7, K_KP8: 8, K_KP9: 9}
+
+    # Every font is loaded once, and every text drawn more than once is rendered once, e.g. the 9 numbers in black for
+    # the game and in red for the player.
+    fonts = {}
+    glyphs = {}
+
+    def font(size):
+        """
+        Load the font of the game, or take it from the cache if it has been loaded before.
+
+        :param size: Font size.
+        :return: the font.
+        """
+        if size not in fonts:
+            fonts[size] = pygame.font.SysFont("comicsans", size)
+        return fonts[size]
+
+    def glyph(text, size, color):
+        """
+        Render a text with the font of the game, or take it from the cache if it has been rendered before.
+
+        :param text: Text to be rendered.
+        :param size: Font size.
+        :param color: Text color.
+        :return: a surface with the rendered text.
+        """
+        if (text, size, color) not in glyphs:
+            glyphs[text, size, color] = font(size).render(text, True, color)
+        return glyphs[text, size, color]
+
+    for num in range(1, 10):
+        glyph(str(num), 44, (0, 0, 0))
+        glyph(str(num), 44, (255, 0, 0))
+
+    class Board(pygame.sprite.Sprite):
+        blank = None  # The empty board, drawn once and copied for every new game.
+
+        def __init__(self):
+            """
+            Set up the Sudoku board and define necessary functionalities including addGameValue and addPlayerValue.
+            """
+            super(Board, self).__init__()
+            if Board.blank is None:
+                Board.blank = pygame.Surface((396, 396))
+                Board.blank.fill((255, 255, 255))
+                pygame.draw.rect(surface=Board.blank, color=(0, 0, 0),
+                                 rect=Board.blank.get_rect(center=(198, 198)),
+                                 width=5)
+                for i in range(8):
+                    pygame.draw.line(surface=Board.blank, color=(0, 0, 0), start_pos=(44 * (i + 1), 0),
+                                     end_pos=(44 * (i + 1), 396), width=3 if i in [2, 5] else 1)
+                for i in range(8):
+                    pygame.draw.line(surface=Board.blank, color=(0, 0, 0), start_pos=(0, 44 * (i + 1)),
+                                     end_pos=(396, 44 * (i + 1)), width=3 if i in [2, 5] else 1)
+            self.surf = Board.blank.copy()
+            self.rect = self.surf.get_rect(center=(270, 280))
+            dirty.append(self.rect)
+
+        def addGameValue(self, text, x, y):
+            """
+            Add numbers originally filled in the Sudoku board.
+
+            :param text: Number to be filled.
+            :param x: x position.
+            :param y: y position.
+            """
+            if text is not None:
+                img = glyph(text, 44, (0, 0, 0))
+                rect = img.get_rect(center=(x, y))
+                self.surf.blit(img, rect)
+                dirty.append(rect.move(self.rect.topleft))
+
+        def addPlayerValue(self, text, x, y, color):
+            """
+            Add numbers filled by the player or shade the cell in the Sudoku board.
+
+            :param text: Number to be filled.
+            :param x: x position.
+            :param y: y position.
+            :param color: Colors are added to enable choice between filling a number or just shading the cell.
+            """
+            if text is not None:  # Add numbers filled by the player.
+                img = glyph(text, 44, color)
+                rect = img.get_rect(center=(x, y))
+                self.surf.blit(img, rect)
+            else:  # Shade the current cell.
+                rect = pygame.Rect(x + 4, y + 4, 37, 37)
+                pygame.draw.rect(surface=self.surf, color=color, rect=rect, width=0)
+            dirty.append(rect.move(self.rect.topleft))
+
+    class Option(pygame.sprite.Sprite):
+        def __init__(self, center, width, text=None, border=True):
+            """
+            Add options for the game such as "New Game", "Hint", etc.
+
+            :param center: Center position of the option box.
+            :param width: Width of the option box.
+            :param text: Text to be added in the option box.
+            :param border: Control whether to generate the option box or to cover it.
+            """
+            super(Option, self).__init__()
+            self.surf = pygame.Surface((width, 50))
+            self.rect = self.surf.get_rect(center=center)
+            self.border = border
+            self.setText(text)
+
+        def setText(self, text, cached=True):
+            """
+            Draw the option box again with another text, so that the same box can show different messages.
+
+            :param text: Text to be added in the option box.
+            :param cached: (optional) Whether to keep the rendered text for later, which is only worth it for a text
+                that comes back. The default is to keep it.
+            """
+            width = self.rect.width
+            self.surf.fill((255, 255, 255))
+            pygame.draw.rect(surface=self.surf, color=(0, 0, 0) if self.border else (255, 255, 255),
+                             rect=self.surf.get_rect(center=(width // 2, 25)),
+                             width=3)
+
+            if text is not None:
+                words = glyph(text, 40, (0, 0, 0)) if cached else font(40).render(text, True, (0, 0, 0))
+                words_rect = words.get_rect(center=(width // 2, 25))
+                self.surf.blit(words, words_rect)
+
+    def show(entity):
+        """
+        Draw a box such as a message straight on the screen. None of them overlaps a sprite.
+
+        :param entity: an Option to draw.
+        """
+        screen.blit(entity.surf, entity.rect)
+        dirty.append(entity.rect)
+
+    board = Board()
+    all_sprites = pygame.sprite.Group()
+    all_sprites.add(board)
+    option = []
+
+    # Define the 4 options for the game.
+    for i, j in zip(range(4), ["New Game", "Start Over", "Hint", "Finish"]):
+        option.append(Option(center=(650, 130 + i * 100), text=j, width=200))
+        all_sprites.add(option[-1])
+
+    # Define the difficulty levels.
+    level = []
+    for i, j in zip(range(3), ["Easy", "Medium", "Hard"]):
+        new_level = Option(center=(150 + i * 250, 520), text=j, width=200)
+        level.append(new_level)
+
+    # Define the boxes to cover all difficulty levels once one has been selected.
+    cover = []
+    for i in range(3):
+        new_cover = Option(center=(150 + i * 250, 520), border=False, width=200)
+        cover.append(new_cover)
+
+    # Define the 2 messages once the player clicks "Finish".
+    message = []
+    for i, j in zip(range(2), ["Hmm, something doesn't look right.", "Congratulations! You solved it!"]):
+        new_message = Option(center=(400, 520), text=j, width=600)
+        message.append(new_message)
+
+    # Define the box to cover the message box.
+    cover_message = Option(center=(400, 520), border=False, width=600)
+
+    # Define the box of the hints. Its text is changed for every hint.
+    hint_message = Option(center=(400, 520), width=600)
+
+    # Define the indicators and object holders.
+    rowIndex = colIndex = blockIndex = None
+    newgame = False
+    rm_message = False
+    hints = None  # Keeps the cells left to fill or filled wrong, in the order of the solving sequence.
+    rm_hint = False
+    toFill = set()
+    filled = {}
+    tracker = MoveTracker()  # Counts the numbers of every row, column and block, filled by the game or the player.
+    clicked = (None, None)
+    grid = None
+
+    def redraw(i, j, selected=False):
+        """
+        Draw a number filled by the player again, with the cell shaded if it is selected or if its number conflicts
+        with another one in its row, column or block.
+
+        :param i: Row of the cell.
+        :param j: Column of the cell.
+        :param selected: (optional) Whether the cell is selected. The default is not.
+        """
+        if selected:
+            shade = (211, 211, 211)
+        elif tracker.conflict(i * 9 + j):
+            shade = (255, 200, 200)
+        else:
+            shade = (255, 255, 255)
+        board.addPlayerValue(text=None, x=j * 44, y=i * 44, color=shade)
+        board.addPlayerValue(text=filled[i, j], x=j * 44 + 22, y=i * 44 + 22, color=(255, 0, 0))
+
+    def redrawPeers(i, j, num):
+        """
+        Draw the numbers filled by the player in the row, column and block of a cell again, if they are the same as
+        the number just filled in or deleted from the cell, as they may have started or stopped conflicting with it.
+
+        :param i: Row of the cell.
+        :param j: Column of the cell.
+        :param num: Number filled in or deleted from the cell.
+        """
+        for c in PEERS[i * 9 + j]:
+            if tracker.board[c] == num and (c // 9, c % 9) in filled:
+                redraw(c // 9, c % 9)
+
+    # Draw everything once. After that, only the rectangles changed by the events are drawn again.
+    for entity in all_sprites:
+        screen.blit(entity.surf, entity.rect)
+    pygame.display.flip()
+    if on_render is not None:
+        on_render([screen.get_rect()])
+    dirty = []
+    clock = pygame.time.Clock()
+
+    while running:
+        # Sleep until an input signal comes in, i.e. mouse clicking or key typing, then handle it together with all the
+        # signals already waiting.
+        for event in [pygame.event.wait()] + pygame.event.get():
+            if event.type == QUIT:
+                running = False
+            elif event.type == VIDEOEXPOSE:  # The window has to be drawn again as a whole.
+                dirty.append(screen.get_rect())
+            elif event.type == MOUSEBUTTONDOWN:
+                x, y = event.pos
+                if board.rect.collidepoint(x, y):  # If one cell is clicked.
+                    if clicked[0] is not None:  # Check whether the current cell has been selected by last move.
+                        if clicked in filled:
+                            redraw(*clicked)  # Remove shade, and add in the previously filled number.
+                        else:
+                            board.addPlayerValue(text=None, x=clicked[1] * 44,
+                                                 y=clicked[0] * 44, color=(255, 255, 255))  # Remove shade.
+                        clicked = (None, None)
+                    rowIndex = (y - 82) // 44
+                    colIndex = (x - 72) // 44
+                    blockIndex = (y - 82) // 132 * 3 + (x - 72) // 132
+                    if (rowIndex, colIndex) in toFill:
+                        if (rowIndex, colIndex) in filled:
+                            # If already filled, add in the previously filled number.
+                            redraw(rowIndex, colIndex, selected=True)
+                        else:
+                            board.addPlayerValue(text=None, x=colIndex * 44,
+                                                 y=rowIndex * 44, color=(211, 211, 211))  # Add shade.
+                        clicked = (rowIndex, colIndex)
+                else:  # If areas other than the board is clicked such as the option box.
+                    if clicked[0] is not None:
+                        if clicked in filled:
+                            redraw(*clicked)  # Remove shade, and add in the previously filled number.
+                        else:
+                            board.addPlayerValue(text=None, x=clicked[1] * 44,
+                                                 y=clicked[0] * 44, color=(255, 255, 255))  # Remove shade.
+                        clicked = (None, None)
+                    rowIndex = colIndex = blockIndex = None
+                    if rm_message:  # If the message should be covered.
+                        show(cover_message)
+                        rm_message = False
+                    elif rm_hint:  # If the hint should be covered.
+                        show(cover_message)
+                        rm_hint = False
+                    elif option[0].rect.collidepoint(x, y):  # If "New Game" is clicked.
+                        for i in range(3):
+                            show(level[i])
+                        newgame = True
+                    elif any(l.rect.collidepoint(x, y) for l in level):  # If a difficulty level is selected.
+                        if newgame:
+                            # Reset.
+                            board.kill()
+                            all_sprites.remove(board)
+                            board = Board()
+                            all_sprites.add(board)
+
+                            # The games and their solving sequences are taken from the pool, which has them ready.
+                            if level[0].rect.collidepoint(x, y):
+                                grid, sequence = pool.get("easy")
+                            elif level[1].rect.collidepoint(x, y):
+                                grid, sequence = pool.get("medium")
+                            elif level[2].rect.collidepoint(x, y):
+                                grid, sequence = pool.get("hard")
+
+                            tracker = MoveTracker([num for line in grid for num in line])
+                            hints = HintIndex(tracker.board, sequence)
+                            toFill = set()
+                            for i in range(9):
+                                for j in range(9):
+                                    if grid[i][j]:
+                                        board.addGameValue(str(grid[i][j]), j * 44 + 22, i * 44 + 22)
+                                    else:
+                                        toFill.add((i, j))
+                            filled = {}
+
+                            for i in range(3):
+                                show(cover[i])
+                            newgame = False
+                    elif newgame:
+                        pass
+                    elif option[1].rect.collidepoint(x, y):  # If "Start Over" is selected.
+                        for i, j in filled.copy():
+                            board.addPlayerValue(text=None, x=j * 44,
+                                                 y=i * 44, color=(255, 255, 255))
+                        toFill = set()
+                        if grid is not None:
+                            tracker = MoveTracker([num for line in grid for num in line])
+                            hints = HintIndex(tracker.board, sequence)
+                            for i in range(9):
+                                for j in range(9):
+                                    if grid[i][j]:
+                                        board.addGameValue(str(grid[i][j]), j * 44 + 22, i * 44 + 22)
+                                    else:
+                                        toFill.add((i, j))
+                        filled = {}
+                    elif option[2].rect.collidepoint(x, y):  # If "Hint" is selected.
+                        hint = hints.hint() if hints is not None else None
+                        if hint is not None:
+                            i, j, value = hint
+                            hint_message.setText("Cell at row {} and column {} = {}".format(i + 1, j + 1, value),
+                                                 cached=False)
+                            show(hint_message)
+                            rm_hint = True
+                    elif option[3].rect.collidepoint(x, y):  # If "Finish" is selected.
+                        if tracker.solved():
+                            show(message[1])
+                        else:
+                            show(message[0])
+                        rm_message = True
+            elif event.type == KEYDOWN:  # If a key typing is detected.
+                if event.key == K_ESCAPE:  # If "ESC" is typed.
+                    running = False
+                elif rowIndex is not None:  # If a valid position has been clicked.
+                    if event.key in keys:  # If a number is typed.
+                        if (rowIndex, colIndex) in toFill and (rowIndex, colIndex) not in filled:
+                            # In order to avoid accidentally replacing filled numbers, a number in a filled cell
+                            # must be deleted before filling in the cell with a different number.
+                            filled[rowIndex, colIndex] = str(keys[event.key])
+                            tracker.place(rowIndex * 9 + colIndex, keys[event.key])
+                            hints.update(rowIndex * 9 + colIndex, keys[event.key])
+                            redraw(rowIndex, colIndex)
+                            redrawPeers(rowIndex, colIndex, keys[event.key])
+                    elif event.key == K_DELETE:  # If a "DELETE" is typed.
+                        if (rowIndex, colIndex) in filled:
+                            board.addPlayerValue(text=None, x=colIndex * 44,
+                                                 y=rowIndex * 44, color=(255, 255, 255))
+                            redrawPeers(rowIndex, colIndex, tracker.remove(rowIndex * 9 + colIndex))
+                            hints.update(rowIndex * 9 + colIndex, 0)
+                            del filled[rowIndex, colIndex]
+
+        # Draw the changed parts of the sprites again, and update only those rectangles of the screen. The frame rate is
+        # capped, so that a burst of events is drawn in one frame.
+        if dirty:
+            for rect in dirty:
+                for entity in all_sprites:
+                    clip = rect.clip(entity.rect)
+                    if clip:
+                        screen.blit(entity.surf, clip, area=clip.move(-entity.rect.left, -entity.rect.top))
+            pygame.display.update(dirty)
+            if on_render is not None:
+                on_render(dirty)
+            dirty = []
+        clock.tick(FRAME_RATE)
+
+    # Quit the game if it finishes running, and keep the games left in the pool for the next session.
+    pool.stop()
+    pygame.display.quit()
+    pygame.quit()
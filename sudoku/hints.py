@@ -0,0 +1,78 @@
+# Hints for a Sudoku game being played. The solution is indexed by cell, and the cells left to fill or filled wrong are
+# kept up to date with every move, so that a hint never has to look through the whole game.
+
+from .board import COL, ROW, write_line
+from .core import Sudoku
+from .grading import next_step
+
+
+class HintIndex:
+
+    def __init__(self, board, sequence=None):
+        """
+        Initiate the hints of a game.
+
+        :param board: a list of 81 numbers of the game in row-major order, where 0 means a blank cell.
+        :param sequence: (optional) The sequence of [row, column, number] that solves the game, e.g. the 3rd element of
+            the 1st output from Sudoku.solver(). Its order is the order in which the hints are given. The default is to
+            solve the game with the "propagate" method when the first hint is asked for.
+        """
+        self.givens = board.copy()
+        self.board = board.copy()  # The numbers filled so far, by the game or the player.
+        self.sequence = sequence
+        self.solution = None
+        self.cells = []  # The cell of each number of the sequence.
+        self.rank = [-1] * 81  # The position of each cell in the sequence, -1 for the given cells.
+        self.outstanding = 0  # Bit k is set while the k-th cell of the sequence is empty or filled wrong.
+
+    def index(self):
+        """
+        Index the solution by cell, solving the game first if no sequence was given.
+        """
+        if self.sequence is None:
+            self.sequence = Sudoku().solver(write_line(self.givens), method="propagate", verbose=False)[0][2]
+        self.solution = self.givens.copy()
+        for k, (i, j, num) in enumerate(self.sequence):
+            c = i * 9 + j
+            self.solution[c] = num
+            self.rank[c] = k
+            self.cells.append(c)
+            if self.board[c] != num:
+                self.outstanding |= 1 << k
+
+    def update(self, c, num):
+        """
+        Record a move of the player.
+
+        :param c: Row-major index of the cell.
+        :param num: Number filled in the cell, 0 if it was deleted.
+        """
+        self.board[c] = num
+        k = self.rank[c]
+        if self.solution is not None and k >= 0:
+            if num == self.solution[c]:
+                self.outstanding &= ~(1 << k)
+            else:
+                self.outstanding |= 1 << k
+
+    def hint(self, technique=False):
+        """
+        Give the next cell to fill, i.e. the first cell of the sequence that is empty or filled wrong.
+
+        :param technique: (optional) Also give the solving technique that leads to a number, from the cells filled
+            right so far. It is computed only when asked for, and the cell it fills is given instead. If no technique
+            applies, the next cell of the sequence is given with "guess". The default is not to give it.
+        :return: a list with the row, column and number of the cell, plus the technique if asked for, or None if the
+            game is solved.
+        """
+        if self.solution is None:
+            self.index()
+        if not self.outstanding:
+            return None
+        c = self.cells[(self.outstanding & -self.outstanding).bit_length() - 1]
+        if not technique:
+            return [ROW[c], COL[c], self.solution[c]]
+        step = next_step([num if num == self.solution[n] else 0 for n, num in enumerate(self.board)])
+        if step is None:
+            return [ROW[c], COL[c], self.solution[c], "guess"]
+        return [ROW[step[0]], COL[step[0]], step[1], step[2]]
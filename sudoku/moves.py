@@ -0,0 +1,81 @@
+# Tracking of the moves made on a Sudoku board, e.g. by a player. Every row, column and block counts how many times
+# each number is in it, so that checking a move, finding the conflicts and telling whether the game is solved never
+# have to scan the board.
+
+from .board import BOX, COL, ROW
+
+
+class MoveTracker:
+
+    def __init__(self, board=None):
+        """
+        Initiate the tracker with the numbers already filled in a board.
+
+        :param board: (optional) a list of 81 numbers in row-major order, where 0 means a blank cell. The default is an
+            empty board.
+        """
+        self.board = [0] * 81
+        self.counts = [[0] * 10 for _ in range(27)]  # How many times each number is in each unit, same order as UNITS.
+        self.conflicts = 0  # Number of (unit, number) pairs with the number more than once in the unit.
+        self.filled = 0
+        if board is not None:
+            for c, num in enumerate(board):
+                if num:
+                    self.place(c, num)
+
+    def place(self, c, num):
+        """
+        Fill a number in an empty cell, even if it conflicts with another one.
+
+        :param c: Row-major index of the cell.
+        :param num: Number to be filled.
+        """
+        counts = self.counts
+        for unit in (ROW[c], 9 + COL[c], 18 + BOX[c]):
+            counts[unit][num] += 1
+            if counts[unit][num] == 2:
+                self.conflicts += 1
+        self.board[c] = num
+        self.filled += 1
+
+    def remove(self, c):
+        """
+        Remove the number filled in a cell.
+
+        :param c: Row-major index of the cell.
+        :return: the number removed, or 0 if the cell was empty.
+        """
+        num = self.board[c]
+        if num:
+            counts = self.counts
+            for unit in (ROW[c], 9 + COL[c], 18 + BOX[c]):
+                if counts[unit][num] == 2:
+                    self.conflicts -= 1
+                counts[unit][num] -= 1
+            self.board[c] = 0
+            self.filled -= 1
+        return num
+
+    def valid(self, c, num):
+        """
+        :param c: Row-major index of an empty cell.
+        :param num: Number to be filled.
+        :return: True if the number is not in the row, column and block of the cell yet, otherwise False.
+        """
+        counts = self.counts
+        return not (counts[ROW[c]][num] or counts[9 + COL[c]][num] or counts[18 + BOX[c]][num])
+
+    def conflict(self, c):
+        """
+        :param c: Row-major index of a cell.
+        :return: True if the number of the cell is also in its row, column or block, otherwise False.
+        """
+        num = self.board[c]
+        counts = self.counts
+        return bool(num) and (counts[ROW[c]][num] > 1 or counts[9 + COL[c]][num] > 1 or counts[18 + BOX[c]][num] > 1)
+
+    def solved(self):
+        """
+        :return: True if every cell is filled and no number conflicts with another one, otherwise False.
+        """
+        return self.filled == 81 and not self.conflicts
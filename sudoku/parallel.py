@@ -0,0 +1,88 @@
+# Solving batches of Sudoku games with a pool of worker processes.
+
+from multiprocessing import Pool
+from random import Random
+import os
+import time
+
+from .core import Sudoku
+from .files import read_games, write_games
+
+
+def solve_one(task):
+    """
+    Solve one Sudoku game for solve_many(). It is defined at the module level so that it can be sent to the worker
+    processes.
+
+    :param task: a tuple of the Sudoku grid, the method and the random seed to use.
+    :return: the output from Sudoku.solver().
+    """
+    grid, method, random_state = task
+    return Sudoku().solver(array=grid, method=method, random_state=random_state, verbose=False)
+
+
+def solve_many(grids, method="sorted", workers=None, random_state=None, chunksize=None, verbose=True):
+    """
+    Solve a batch of Sudoku games with a pool of worker processes. The games are sent to the workers in chunks and the
+    results are returned in the same order as the games. Each game gets its own random seed, drawn in order from
+    random_state, so that the result of a game only depends on random_state and its position in the batch, no matter
+    how many workers are used.
+
+    :param grids: Sudoku grids to solve. Any iterable works, and it is consumed lazily.
+    :param method: (optional) Solver method to use, same as Sudoku.solver(). The default is "sorted".
+    :param workers: (optional) Number of worker processes. The default is the number of CPUs. With 1 worker, all the
+        games are solved in the current process.
+    :param random_state: (optional) a user-defined random seed to generate reproducible results.
+    :param chunksize: (optional) Number of games sent to a worker at a time. The default spreads the batch over about 4
+        chunks per worker.
+    :param verbose: (optional) Decide whether to print the throughput. The default is to print it.
+    :return: a list with the output from Sudoku.solver() for each game.
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(grids) // (workers * 4)) if hasattr(grids, "__len__") else 64
+    rng = Random(random_state)
+    tasks = ((grid, method, None if random_state is None else rng.getrandbits(64)) for grid in grids)
+
+    start = time.time()
+    if workers == 1:
+        res = [solve_one(task) for task in tasks]
+    else:
+        with Pool(workers) as pool:
+            res = list(pool.imap(solve_one, tasks, chunksize))
+    end = time.time()
+    if verbose:
+        print("Solved {} games in {:.3f} seconds ({:.1f} games per second)".format(
+            len(res), end - start, len(res) / max(end - start, 1e-9)))
+    return res
+
+
+def solve_file(source, target, method="propagate", workers=1, random_state=None, chunksize=64, verbose=True):
+    """
+    Solve all the Sudoku games of a file in the 81-character line format and write the solutions to another file in the
+    same format, in the same order. The games are streamed from one file to the other, so that the whole file is never
+    held in memory. A game that cannot be solved is written back as it is.
+
+    :param source: Path of the file to read the games from.
+    :param target: Path of the file to write the solutions to.
+    :param method: (optional) Solver method to use, same as Sudoku.solver(). The default is "propagate".
+    :param workers: (optional) Number of worker processes, same as solve_many(). The default is 1.
+    :param random_state: (optional) a user-defined random seed to generate reproducible results.
+    :param chunksize: (optional) Number of games sent to a worker at a time. The default is 64.
+    :param verbose: (optional) Decide whether to print the throughput. The default is to print it.
+    :return: Number of games solved.
+    """
+    rng = Random(random_state)
+    tasks = ((line, method, None if random_state is None else rng.getrandbits(64)) for line in read_games(source))
+
+    start = time.time()
+    if workers == 1:
+        n = write_games(target, (solve_one(task)[1] for task in tasks))
+    else:
+        with Pool(workers) as pool:
+            n = write_games(target, (res[1] for res in pool.imap(solve_one, tasks, chunksize)))
+    end = time.time()
+    if verbose:
+        print("Solved {} games in {:.3f} seconds ({:.1f} games per second)".format(
+            n, end - start, n / max(end - start, 1e-9)))
+    return n
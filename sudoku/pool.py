@@ -0,0 +1,160 @@
+# A pool of pre-generated Sudoku games, so that a new game can be handed out at once instead of being generated while
+# the player waits. The pool is refilled by a background thread and can be saved to disk between sessions.
+
+import json
+import os
+import threading
+from random import Random
+
+from .core import Sudoku
+from .grading import GRADES
+
+
+class PuzzlePool:
+
+    def __init__(self, size=5, difficulties=None, path=None, random_state=None):
+        """
+        Initiate the pool, loading the games saved by an earlier session if any.
+
+        :param size: (optional) Number of games to keep ready for each difficulty. The default is 5.
+        :param difficulties: (optional) Difficulties to keep games for. The default is all of GRADES.
+        :param path: (optional) JSON file to load the pool from and save it to. The default is not to persist it.
+        :param random_state: (optional) a user-defined random seed to generate reproducible games.
+        """
+        self.size = size
+        self.difficulties = GRADES if difficulties is None else difficulties
+        self.path = path
+        self.sudoku = Sudoku()
+        self.rng = Random(random_state)
+        self.games = {difficulty: [] for difficulty in self.difficulties}
+        self.changed = threading.Condition()  # Guards self.games and self.rng, and wakes the worker up.
+        self.worker = None
+        self.stopping = False
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def make(self, difficulty, random_state):
+        """
+        Generate a game together with the solving sequence of its solution.
+
+        :param difficulty: Difficulty of the game, same as for Sudoku.generator().
+        :param random_state: Random seed of the game.
+        :return: a list with the game grid and the sequence of [row, column, number] that solves it.
+        """
+        grid = self.sudoku.generator(difficulty=difficulty, random_state=random_state)
+        return [grid, self.sudoku.solver(grid, method="propagate", verbose=False)[0][2]]
+
+    def get(self, difficulty):
+        """
+        Take a game out of the pool, and wake the worker up to replace it. If no game of that difficulty is ready, one
+        is generated right away.
+
+        :param difficulty: Difficulty of the game.
+        :return: a list with the game grid and the sequence of [row, column, number] that solves it.
+        """
+        with self.changed:
+            games = self.games.setdefault(difficulty, [])
+            game = games.pop() if games else None
+            random_state = None if game is not None else self.rng.getrandbits(32)
+            self.changed.notify()
+        return game if game is not None else self.make(difficulty, random_state)
+
+    def fill(self):
+        """
+        Generate games until every difficulty has self.size of them ready, in the calling thread.
+        """
+        while True:
+            with self.changed:
+                missing = [d for d in self.difficulties if len(self.games[d]) < self.size]
+                if not missing:
+                    return
+                difficulty = min(missing, key=lambda d: len(self.games[d]))
+                random_state = self.rng.getrandbits(32)
+            game = self.make(difficulty, random_state)
+            with self.changed:
+                self.games[difficulty].append(game)
+
+    def work(self):
+        """
+        Run the background worker, which refills the pool whenever a game is taken out, until stop() is called.
+        """
+        while True:
+            with self.changed:
+                while not self.stopping and all(len(self.games[d]) >= self.size for d in self.difficulties):
+                    self.changed.wait()
+                if self.stopping:
+                    return
+                difficulty = min(self.difficulties, key=lambda d: len(self.games[d]))
+                random_state = self.rng.getrandbits(32)
+            game = self.make(difficulty, random_state)
+            with self.changed:
+                self.games[difficulty].append(game)
+
+    def start(self):
+        """
+        Start the background worker. It is a daemon thread, so that it never keeps the program from exiting.
+        """
+        if self.worker is None:
+            self.stopping = False
+            self.worker = threading.Thread(target=self.work, name="PuzzlePool", daemon=True)
+            self.worker.start()
+
+    def stop(self):
+        """
+        Stop the background worker once it is done with the game being generated, and save the pool if it has a path.
+        """
+        if self.worker is not None:
+            with self.changed:
+                self.stopping = True
+                self.changed.notify()
+            self.worker.join()
+            self.worker = None
+        if self.path is not None:
+            self.save(self.path)
+
+    def save(self, path):
+        """
+        Save the games of the pool as JSON. The file is replaced at once, so that it is never left half written.
+
+        :param path: Path of the file to write.
+        """
+        with self.changed:
+            games = {difficulty: list(games) for difficulty, games in self.games.items()}
+        with open(path + ".tmp", "w") as f:
+            json.dump(games, f)
+        os.replace(path + ".tmp", path)
+
+    def load(self, path):
+        """
+        Add the games saved by save() to the pool. A file that cannot be read is ignored, as the pool can always be
+        generated again. So is a file that does not hold a list of games for each difficulty, and any game that is not a
+        grid of 9 rows of numbers with its sequence of [row, column, number].
+
+        :param path: Path of the file to read.
+        """
+        try:
+            with open(path) as f:
+                games = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(games, dict) or not all(isinstance(saved, list) for saved in games.values()):
+            return
+
+        def valid(game):
+            """
+            :param game: an entry of the file.
+            :return: True if it is a list with a 9x9 grid of numbers from 0 to 9 and a list of [row, column, number]
+                with each of them from 0 to 8, 0 to 8 and 1 to 9, otherwise False.
+            """
+            if not isinstance(game, list) or len(game) != 2 or not isinstance(game[0], list) or \
+                    not isinstance(game[1], list) or len(game[0]) != 9:
+                return False
+            if not all(isinstance(row, list) and len(row) == 9 and
+                       all(type(num) is int and 0 <= num <= 9 for num in row) for row in game[0]):
+                return False
+            return all(isinstance(step, list) and len(step) == 3 and all(type(num) is int for num in step) and
+                       0 <= step[0] <= 8 and 0 <= step[1] <= 8 and 1 <= step[2] <= 9 for step in game[1])
+
+        with self.changed:
+            for difficulty, saved in games.items():
+                self.games.setdefault(difficulty, []).extend(game for game in saved if valid(game))
@@ -0,0 +1,419 @@
+# A local solver service, so that other programs can solve and generate games without importing the package. It speaks
+# a small subset of HTTP/1.1 with JSON bodies over TCP or a Unix socket. Requests are gathered into micro-batches that
+# are solved by a pool of worker processes, and solutions are kept in an LRU cache keyed by the canonical game line.
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from random import Random
+
+from .benchmark import summary
+from .board import read_line, write_line
+from .core import Sudoku
+
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+
+def run_batch(tasks):
+    """
+    Run a batch of requests in a worker process. It is defined at the module level so that it can be sent to the
+    worker processes. A task that fails does not fail the others of its batch.
+
+    :param tasks: a list of ("solve", game line, solver method) or ("generate", difficulty, random seed) tuples.
+    :return: a list with, for each task, a tuple of its result and None, or of None and the error message if it failed.
+        The result is the solution or the game in the 81-character line format as a string, or None if the game could
+        not be solved.
+    """
+    sudoku = Sudoku()
+    res = []
+    for kind, arg, option in tasks:
+        try:
+            if kind == "solve":
+                out = sudoku.solver(arg, method=option, verbose=False)
+                res.append((out[1].decode() if out[0][0] else None, None))
+            else:
+                res.append((write_line(sudoku.generator(difficulty=arg, random_state=option)).decode(), None))
+        except Exception as error:
+            res.append((None, "{}: {}".format(type(error).__name__, error)))
+    return res
+
+
+def canonical(game):
+    """
+    Write a game in the canonical form used as the cache key, i.e. the 81-character line format with "0" for blanks.
+
+    :param game: a game in the 81-character line format, where "." is also a blank, or a list of 9 rows of numbers
+        from 0 to 9.
+    :return: the canonical line as a string. A ValueError is raised if the game is not in one of these formats.
+    """
+    if isinstance(game, str):
+        if len(game) < 81:
+            raise ValueError("A game needs 81 characters")
+        if game[:81].strip("0123456789."):
+            raise ValueError("A game line can only hold the digits 0 to 9 and '.'")
+        return write_line(read_line(game)).decode()
+    if len(game) != 9 or any(len(row) != 9 for row in game):
+        raise ValueError("A game needs 9 rows of 9 numbers")
+    if any(type(num) is not int or not 0 <= num <= 9 for row in game for num in row):
+        raise ValueError("A game can only hold the numbers 0 to 9")
+    return write_line(game).decode()
+
+
+class SolverServer:
+
+    def __init__(self, workers=None, method="propagate", cache_size=10000, max_batch=64, max_delay=0.002,
+                 random_state=None):
+        """
+        Initiate the server. Nothing is started until serve() is awaited.
+
+        :param workers: (optional) Number of worker processes. The default is the number of CPUs. With 1 worker, the
+            batches are run by a thread of the current process.
+        :param method: (optional) Solver method to use, same as Sudoku.solver(). The default is "propagate".
+        :param cache_size: (optional) Maximum number of solutions kept in the LRU cache. The default is 10000.
+        :param max_batch: (optional) Maximum number of requests in a batch. The default is 64.
+        :param max_delay: (optional) Seconds to wait for more requests once the first one of a batch came in. The
+            default is 0.002.
+        :param random_state: (optional) a user-defined random seed for the games generated without a seed.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.method = method
+        self.cache_size = cache_size
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.rng = Random(random_state)
+        self.cache = OrderedDict()  # Canonical game line to its solution, or None if it has none.
+        self.pending = {}  # Canonical game line to the future of its solution while it is being solved.
+        self.queue = None
+        self.executor = None
+        self.counts = {"requests": 0, "hits": 0, "misses": 0, "batches": 0, "batched": 0}
+
+    async def submit(self, task):
+        """
+        Queue a task for the next batch and wait for its result.
+
+        :param task: a task tuple, same as for run_batch().
+        :return: the result of the task from run_batch(). A ValueError is raised if the task failed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((task, future))
+        return await future
+
+    async def solve(self, game):
+        """
+        Solve a game, from the cache if it was solved before. The same game asked again while it is being solved waits
+        for the same result instead of being solved twice.
+
+        :param game: a game in any format accepted by canonical().
+        :return: a tuple of the solution in the 81-character line format, or None if the game has no solution, and
+            whether it came from the cache.
+        """
+        key = canonical(game)
+        self.counts["requests"] += 1
+        if key in self.cache:
+            self.counts["hits"] += 1
+            self.cache.move_to_end(key)
+            return self.cache[key], True
+        if key in self.pending:
+            self.counts["hits"] += 1
+            return await asyncio.shield(self.pending[key]), True
+        self.counts["misses"] += 1
+        future = self.pending[key] = asyncio.ensure_future(self.submit(("solve", key, self.method)))
+        try:
+            solution = await asyncio.shield(future)
+        finally:
+            del self.pending[key]
+        self.cache[key] = solution
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return solution, False
+
+    async def generate(self, difficulty="easy", random_state=None):
+        """
+        Generate a game. Games are never cached, as each call should give a new one.
+
+        :param difficulty: (optional) Difficulty of the game, same as for Sudoku.generator(). The default is "easy".
+        :param random_state: (optional) a user-defined random seed. The default is to draw one from self.rng.
+        :return: the game in the 81-character line format.
+        """
+        self.counts["requests"] += 1
+        if random_state is None:
+            random_state = self.rng.getrandbits(32)
+        return await self.submit(("generate", difficulty, random_state))
+
+    async def batcher(self):
+        """
+        Gather the queued tasks into batches and send them to the workers, with at most one batch per worker at a time.
+        A batch is sent once it is full, or max_delay seconds after its first task came in.
+        """
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.workers)
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await slots.acquire()
+            self.counts["batches"] += 1
+            self.counts["batched"] += len(batch)
+            loop.create_task(self.dispatch(batch, slots))
+
+    async def dispatch(self, batch, slots):
+        """
+        Run a batch on the workers and hand each result to the task waiting for it.
+
+        :param batch: a list of (task, future) tuples.
+        :param slots: the semaphore of the free workers, released once the batch is done.
+        """
+        try:
+            res = await asyncio.get_running_loop().run_in_executor(self.executor, run_batch, [t for t, _ in batch])
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for (_, future), (out, error) in zip(batch, res):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(out)
+                else:
+                    future.set_exception(ValueError(error))
+        finally:
+            slots.release()
+
+    def stats(self):
+        """
+        :return: a dictionary with the request, cache hit and miss and batch counts, the cache hit rate, the cache size
+            and the mean batch size.
+        """
+        res = dict(self.counts)
+        lookups = res["hits"] + res["misses"]
+        res["hit_rate"] = res["hits"] / lookups if lookups else 0.0
+        res["cache_size"] = len(self.cache)
+        res["mean_batch"] = res["batched"] / res["batches"] if res["batches"] else 0.0
+        return res
+
+    async def route(self, verb, target, body):
+        """
+        Answer one request.
+
+        :param verb: HTTP method of the request.
+        :param target: Path of the request, i.e. "/solve", "/generate" or "/stats".
+        :param body: Body of the request, a JSON object for "/solve" and "/generate".
+        :return: a tuple of the HTTP status and the JSON object to answer.
+        """
+        if target == "/stats" and verb == "GET":
+            return 200, self.stats()
+        if verb != "POST" or target not in ["/solve", "/generate"]:
+            return 404, {"error": "Unknown request {} {}".format(verb, target)}
+        try:
+            data = json.loads(body or b"{}")
+            if target == "/solve":
+                solution, cached = await self.solve(data["game"])
+                return 200, {"solution": solution, "cached": cached}
+            random_state = data.get("random_state")
+            if random_state is not None and (not isinstance(random_state, int) or isinstance(random_state, bool)):
+                raise ValueError("random_state must be an integer")
+            game = await self.generate(data.get("difficulty", "easy"), random_state)
+            return 200, {"game": game}
+        except (KeyError, TypeError, ValueError) as error:
+            return 400, {"error": str(error)}
+
+    async def handle(self, reader, writer):
+        """
+        Serve the requests of one connection, which is kept open until the client closes it or asks to.
+
+        :param reader: the asyncio.StreamReader of the connection.
+        :param writer: the asyncio.StreamWriter of the connection.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                parts = line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in [b"\r\n", b"\n", b""]:
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if len(parts) < 2:
+                    status, payload = 400, {"error": "Malformed request line"}
+                else:
+                    body = await reader.readexactly(int(headers.get("content-length", 0)))
+                    status, payload = await self.route(parts[0], parts[1], body)
+                data = json.dumps(payload).encode()
+                writer.write("HTTP/1.1 {} {}\r\nContent-Type: application/json\r\nContent-Length: {}\r\n\r\n".format(
+                    status, STATUS[status], len(data)).encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, path=None, ready=None):
+        """
+        Start the workers and listen for requests until cancelled.
+
+        :param host: (optional) Address to listen on. The default is "127.0.0.1".
+        :param port: (optional) Port to listen on. The default is 8765.
+        :param path: (optional) Path of a Unix socket to listen on instead of host and port.
+        :param ready: (optional) a threading.Event to set once the server listens.
+        """
+        self.queue = asyncio.Queue()
+        if self.workers == 1:
+            self.executor = ThreadPoolExecutor(1)
+        else:
+            self.executor = ProcessPoolExecutor(self.workers)
+        batcher = asyncio.ensure_future(self.batcher())
+        try:
+            if path is not None:
+                server = await asyncio.start_unix_server(self.handle, path)
+            else:
+                server = await asyncio.start_server(self.handle, host, port)
+            async with server:
+                if ready is not None:
+                    ready.set()
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            self.executor.shutdown()
+
+
+def serve(host="127.0.0.1", port=8765, path=None, ready=None, **options):
+    """
+    Run a SolverServer until interrupted.
+
+    :param host: (optional) Address to listen on. The default is "127.0.0.1".
+    :param port: (optional) Port to listen on. The default is 8765.
+    :param path: (optional) Path of a Unix socket to listen on instead of host and port.
+    :param ready: (optional) a threading.Event to set once the server listens.
+    :param options: (optional) Keyword arguments of SolverServer.
+    """
+    try:
+        asyncio.run(SolverServer(**options).serve(host, port, path, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+def serve_background(host="127.0.0.1", port=8765, path=None, **options):
+    """
+    Run a SolverServer in a daemon thread, e.g. to load test it from the same program.
+
+    :param host: (optional) Address to listen on. The default is "127.0.0.1".
+    :param port: (optional) Port to listen on. The default is 8765.
+    :param path: (optional) Path of a Unix socket to listen on instead of host and port.
+    :param options: (optional) Keyword arguments of SolverServer.
+    :return: the thread, once the server listens.
+    """
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(host, port, path, ready), kwargs=options, name="SolverServer",
+                              daemon=True)
+    thread.start()
+    ready.wait(30)
+    return thread
+
+
+async def request(reader, writer, verb, target, payload=None):
+    """
+    Send one request over an open connection and read its answer.
+
+    :param reader: the asyncio.StreamReader of the connection.
+    :param writer: the asyncio.StreamWriter of the connection.
+    :param verb: HTTP method of the request.
+    :param target: Path of the request.
+    :param payload: (optional) JSON object to send as the body.
+    :return: a tuple of the HTTP status and the JSON object answered.
+    """
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write("{} {} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: {}\r\n\r\n"
+                 .format(verb, target, len(body)).encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in [b"\r\n", b"\n", b""]:
+            break
+        name, _, value = header.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def load_test(games, host="127.0.0.1", port=8765, path=None, concurrency=32):
+    """
+    Send solve requests for all the games over several connections at once, and time each of them.
+
+    :param games: Sudoku games to solve, in any format accepted by canonical(). Repeated games are answered from the
+        cache of the server.
+    :param host: (optional) Address of the server. The default is "127.0.0.1".
+    :param port: (optional) Port of the server. The default is 8765.
+    :param path: (optional) Path of the Unix socket of the server instead of host and port.
+    :param concurrency: (optional) Number of connections sending requests at the same time. The default is 32.
+    :return: a dictionary with the number of requests, failed requests and cached answers, the seconds taken, the
+        throughput in requests per second, the summary of the latency in seconds and the stats of the server.
+    """
+    todo = list(reversed(games))
+    latency = []
+    counts = {"failed": 0, "cached": 0}
+
+    async def connect():
+        if path is not None:
+            return await asyncio.open_unix_connection(path)
+        return await asyncio.open_connection(host, port)
+
+    async def client():
+        reader, writer = await connect()
+        try:
+            while todo:
+                game = todo.pop()
+                start = time.perf_counter()
+                status, answer = await request(reader, writer, "POST", "/solve", {"game": game})
+                latency.append(time.perf_counter() - start)
+                if status != 200 or answer["solution"] is None:
+                    counts["failed"] += 1
+                counts["cached"] += status == 200 and answer["cached"]
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    end = time.perf_counter()
+    reader, writer = await connect()
+    stats = (await request(reader, writer, "GET", "/stats"))[1]
+    writer.close()
+    return {"requests": len(latency), "failed": counts["failed"], "cached": counts["cached"], "seconds": end - start,
+            "throughput": len(latency) / max(end - start, 1e-9), "latency": summary(latency), "server": stats}
+
+
+def load_corpus(requests=2000, distinct=200, difficulty="super hard", random_state=0):
+    """
+    Build the games of a load test: distinct games generated with fixed seeds, each asked several times in a random
+    order, as services asking for the same games again would.
+
+    :param requests: (optional) Number of requests. The default is 2000.
+    :param distinct: (optional) Number of distinct games. The default is 200.
+    :param difficulty: (optional) Difficulty of the games. The default is "super hard".
+    :param random_state: (optional) Random seed of the first game and of the order. The default is 0.
+    :return: a list of games in the 81-character line format, as strings.
+    """
+    sudoku = Sudoku()
+    unique = [write_line(sudoku.generator(difficulty=difficulty, random_state=random_state + n)).decode()
+              for n in range(distinct)]
+    rng = Random(random_state)
+    return [unique[rng.randrange(distinct)] for _ in range(requests)]
@@ -0,0 +1,78 @@
+# Search statistics of the Sudoku solver. A SolveStats object is only filled when it is given to Sudoku.solver(), so
+# that the solver pays no more than a few "is not None" checks when the statistics are not asked for.
+
+import time
+
+
+class SolveStats:
+
+    def __init__(self, on_node=None, on_backtrack=None):
+        """
+        Initiate the statistics of a solve, with optional hooks for profilers or tracing.
+
+        :param on_node: (optional) a function called as on_node(depth) every time a search node is expanded.
+        :param on_backtrack: (optional) a function called as on_backtrack(depth) every time a number is taken back.
+        """
+        self.on_node = on_node
+        self.on_backtrack = on_backtrack
+        self.reset()
+
+    def reset(self):
+        """
+        Set all the statistics back to zero. The solver calls it at the start of every solve.
+        """
+        self.nodes = 0  # Search nodes expanded, including the solved one.
+        self.backtracks = 0  # Numbers taken back after their branch failed.
+        self.max_depth = 0  # Deepest level reached: cells filled for "inorder", "sorted" and "bitmask", guesses else.
+        self.naked_singles = 0  # Cells filled by the naked singles rule of the "propagate" method.
+        self.hidden_singles = 0  # Cells filled by the hidden singles rule of the "propagate" method.
+        self.locked_candidates = 0  # Candidates removed by the locked candidates rule of the "propagate" method.
+        self.sort_time = 0.0  # Seconds spent picking the next cell in the "sorted" method.
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self._start = None
+
+    def start(self):
+        """
+        Reset the statistics and start the wall and CPU clocks.
+        """
+        self.reset()
+        self._start = (time.perf_counter(), time.process_time())
+
+    def stop(self):
+        """
+        Stop the wall and CPU clocks started by start().
+        """
+        self.wall_time = time.perf_counter() - self._start[0]
+        self.cpu_time = time.process_time() - self._start[1]
+
+    def node(self, depth):
+        """
+        Record a search node.
+
+        :param depth: Depth of the node.
+        """
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if self.on_node is not None:
+            self.on_node(depth)
+
+    def backtrack(self, depth):
+        """
+        Record a number taken back.
+
+        :param depth: Depth of the node where the number was filled.
+        """
+        self.backtracks += 1
+        if self.on_backtrack is not None:
+            self.on_backtrack(depth)
+
+    def as_dict(self):
+        """
+        :return: the statistics as a dictionary, e.g. to be saved as JSON.
+        """
+        return {"nodes": self.nodes, "backtracks": self.backtracks, "max_depth": self.max_depth,
+                "naked_singles": self.naked_singles, "hidden_singles": self.hidden_singles,
+                "locked_candidates": self.locked_candidates, "sort_time": self.sort_time,
+                "wall_time": self.wall_time, "cpu_time": self.cpu_time}
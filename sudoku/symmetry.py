@@ -0,0 +1,271 @@
+# Canonical forms of Sudoku games under the symmetries that keep a game valid, i.e. relabeling the numbers, transposing
+# the grid, swapping rows within a band, swapping bands, and the same for columns and stacks. Equivalent games have the
+# same canonical form, so that a solution cached for one of them can be mapped back to any other.
+
+import os
+from collections import OrderedDict
+from itertools import permutations, product
+from math import factorial, prod
+
+from .board import init_masks
+
+# A game with fewer numbers given than this has more than one solution, so it is not worth caching.
+MIN_CLUES = 17
+
+# Maximum number of partial transforms kept while searching the canonical form. Dense, near-full boards are the ones
+# that reach it, as many rows tie and every order of their new numbers is branched on, e.g. a completed board always
+# does. They are left out of the cache rather than searched at length, which costs little as they are cheap to solve.
+MAX_STATES = 100
+
+
+def canonical_form(board):
+    """
+    Find the canonical form of a game, i.e. the smallest board in row-major order that any symmetry can turn it into,
+    once the numbers are relabeled by their first appearance. The rows are chosen one at a time, and only the choices
+    that give the smallest row so far are kept. The columns are not enumerated: those that no row has told apart yet are
+    kept in the same class and ordered later, so that only their stack order and the order of numbers appearing for the
+    first time in the same class are branched on. The first row only depends on the blanks of each stack, so it is
+    picked from their counts alone. That branching grows with the numbers given, so dense, near-full boards give up on
+    MAX_STATES, which costs little as they are cheap to solve anyway.
+
+    :param board: 81 numbers in row-major order, where 0 means a blank cell. The game must be valid.
+    :return: a tuple of the canonical board as a tuple of 81 numbers, and the transform that turns the board into it,
+        for to_canonical() and from_canonical(), or None if the game has fewer than MIN_CLUES numbers given or the
+        search would keep more than MAX_STATES partial transforms.
+    """
+    if 81 - board.count(0) < MIN_CLUES:
+        return None
+    grids = [board, [board[c % 9 * 9 + c // 9] for c in range(81)]]
+    lines = [[grid[r * 9:r * 9 + 9] for r in range(9)] for grid in grids]
+
+    # The smallest first row puts the stacks with the most blanks first, and then has the new numbers of each stack in
+    # any order. A chosen state is (transposed, rows chosen so far, classes of columns in order, labels of the numbers
+    # seen so far, next row).
+    best, chosen = None, []
+    for t in range(2):
+        for r in range(9):
+            blanks = [lines[t][r][3 * s:3 * s + 3].count(0) for s in range(3)]
+            key = sorted(blanks, reverse=True)
+            if best is None or key > best:
+                best, chosen = key, []
+            if key == best:
+                chosen += [(t, (), [tuple(range(3 * s, 3 * s + 3)) for s in stacks], {}, r)
+                           for stacks in permutations(range(3)) if [blanks[s] for s in stacks] == key]
+    canon = []
+    label = 1
+    for blank in best:
+        canon += [0] * blank + list(range(label, label + 3 - blank))
+        label += 3 - blank
+
+    for k in range(1, 10):
+        # Split the classes of the kept states by the numbers of their chosen row. The new numbers of a class can come
+        # in any order, which is the only branching.
+        states = []
+        for t, rows, classes, labels, r in chosen:
+            line = lines[t][r]
+            options = []
+            for cls in classes:
+                blank = tuple(c for c in cls if not line[c])
+                known = sorted((c for c in cls if line[c] in labels), key=lambda c: labels[line[c]])
+                new = [c for c in cls if line[c] and line[c] not in labels]
+                head = ([blank] if blank else []) + [(c,) for c in known]
+                options.append((head, new))
+            if len(states) + prod(factorial(len(new)) for _, new in options) > MAX_STATES:
+                return None
+            options = [[(head, order) for order in permutations(new)] for head, new in options]
+            for split in product(*options):
+                new_classes, new_labels = [], dict(labels)
+                for head, order in split:
+                    new_classes += head
+                    for c in order:
+                        new_classes.append((c,))
+                        new_labels[line[c]] = len(new_labels) + 1
+                states.append((t, rows + (r,), new_classes, new_labels))
+        if k == 9:
+            break
+
+        best, chosen = None, []
+        for t, rows, classes, labels in states:
+            if k % 3:
+                band = rows[-1] // 3
+                free = [r for r in range(3 * band, 3 * band + 3) if r not in rows]
+            else:
+                used = {r // 3 for r in rows}
+                free = [r for r in range(9) if r // 3 not in used]
+            for r in free:
+                # Within a class, the smallest order puts the blanks first, then the numbers already labeled, and then
+                # the new numbers, which get the next labels whatever their order.
+                line = lines[t][r]
+                res = []
+                label = len(labels) + 1
+                for cls in classes:
+                    if len(cls) == 1:
+                        num = line[cls[0]]
+                        if not num:
+                            res.append(0)
+                        elif num in labels:
+                            res.append(labels[num])
+                        else:
+                            res.append(label)
+                            label += 1
+                        continue
+                    nums = [line[c] for c in cls]
+                    new = sum(1 for num in nums if num and num not in labels)
+                    res += [0] * nums.count(0) + sorted(labels[num] for num in nums if num in labels)
+                    res += range(label, label + new)
+                    label += new
+                if best is None or res < best:
+                    best, chosen = res, [(t, rows, classes, labels, r)]
+                elif res == best:
+                    chosen.append((t, rows, classes, labels, r))
+        canon += best
+
+    t, rows, classes, labels = states[0]
+    labels = dict(labels)
+    for num in range(1, 10):
+        if num not in labels:
+            labels[num] = len(labels) + 1
+    return tuple(canon), (t, rows, tuple(c for cls in classes for c in cls), labels)
+
+
+def to_canonical(board, form):
+    """
+    Apply a transform from canonical_form() to a board, e.g. to a solution of the game it was found for.
+
+    :param board: 81 numbers in row-major order.
+    :param form: the transform from canonical_form().
+    :return: the transformed board as a list of 81 numbers.
+    """
+    t, rows, cols, labels = form
+    cells = [r * 9 + c for r in rows for c in cols]
+    if t:
+        cells = [c % 9 * 9 + c // 9 for c in cells]
+    return [labels[board[c]] if board[c] else 0 for c in cells]
+
+
+def from_canonical(board, form):
+    """
+    Undo a transform from canonical_form(), e.g. to map the solution of the canonical form back to the original game.
+
+    :param board: 81 numbers in row-major order, in the canonical frame.
+    :param form: the transform from canonical_form().
+    :return: the board in the original frame as a list of 81 numbers.
+    """
+    t, rows, cols, labels = form
+    nums = {label: num for num, label in labels.items()}
+    res = [0] * 81
+    for n, c in enumerate(r * 9 + c for r in rows for c in cols):
+        res[c % 9 * 9 + c // 9 if t else c] = nums[board[n]] if board[n] else 0
+    return res
+
+
+class SolutionCache:
+
+    def __init__(self, size=10000, path=None):
+        """
+        Initiate the cache of solutions by canonical form, loading the solutions saved by an earlier session if any.
+
+        :param size: (optional) Maximum number of solutions to keep. The least recently used ones are dropped first. The
+            default is 10000.
+        :param path: (optional) JSON file to load the cache from and save it to. The default is not to persist it.
+        """
+        self.size = size
+        self.path = path
+        self.solutions = OrderedDict()  # Canonical form, as a string, to the solution in the canonical frame.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.skipped = 0  # Games left out of the cache by canonical_form(), counted among the misses too.
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def get(self, board):
+        """
+        Look up the solution of a game or of any game equivalent to it.
+
+        :param board: 81 numbers in row-major order, where 0 means a blank cell.
+        :return: a tuple of the solution as 81 numbers, or None if it is not cached or the game is not valid, and the
+            canonical form and transform of the game for put(), or None if the game is not valid or has no canonical
+            form, see canonical_form().
+        """
+        if init_masks(board) is None:
+            self.misses += 1
+            return None, None
+        found = canonical_form(board)
+        if found is None:
+            self.misses += 1
+            self.skipped += 1
+            return None, None
+        canon, form = found
+        key = "".join(map(str, canon))
+        if key not in self.solutions:
+            self.misses += 1
+            return None, (key, form)
+        self.hits += 1
+        self.solutions.move_to_end(key)
+        return from_canonical(self.solutions[key], form), (key, form)
+
+    def put(self, found, solution):
+        """
+        Cache the solution of a game looked up with get().
+
+        :param found: the canonical form and transform returned by get().
+        :param solution: 81 numbers in row-major order, in the frame of the game given to get().
+        """
+        if found is None:
+            return
+        key, form = found
+        self.solutions[key] = to_canonical(solution, form)
+        self.solutions.move_to_end(key)
+        while len(self.solutions) > self.size:
+            self.solutions.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        :return: a dictionary with the hits, misses, hit rate, evictions, games skipped, number of cached solutions and
+            maximum size.
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions, "skipped": self.skipped, "cached": len(self.solutions), "size": self.size}
+
+    def save(self, path=None):
+        """
+        Save the cached solutions as JSON, from the least to the most recently used. The file is replaced at once, so
+        that it is never left half written.
+
+        :param path: (optional) Path of the file to write. The default is self.path.
+        """
+        import json
+        path = self.path if path is None else path
+        with open(path + ".tmp", "w") as f:
+            json.dump({key: "".join(map(str, solution)) for key, solution in self.solutions.items()}, f)
+        os.replace(path + ".tmp", path)
+
+    def load(self, path):
+        """
+        Add the solutions saved by save() to the cache. A file that cannot be read is ignored, as the solutions can
+        always be found again. So is any entry that is not an 81-digit game with a valid completed board that keeps its
+        numbers, as it would otherwise be given back as a solution.
+
+        :param path: Path of the file to read.
+        """
+        import json
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, dict):
+            return
+        for key, solution in saved.items():
+            if not isinstance(solution, str) or len(key) != 81 or len(solution) != 81 or \
+                    not (key + solution).isdigit() or not (key + solution).isascii():
+                continue
+            game = [int(num) for num in key]
+            board = [int(num) for num in solution]
+            if all(board) and all(g in (0, b) for g, b in zip(game, board)) and init_masks(board) is not None:
+                self.solutions[key] = board
+        while len(self.solutions) > self.size:
+            self.solutions.popitem(last=False)
@@ -0,0 +1,127 @@
+# Working on batches of Sudoku games at once with numpy. "numpy" is only needed for this module.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .board import BOX, BYTE_VALUE, COL, LOWBIT, POPCOUNT, ROW, UNITS
+from .core import Sudoku
+
+
+def batch_array(games):
+    """
+    Stack a batch of Sudoku games into a numpy array for the batch functions.
+
+    :param games: Sudoku grids, either as a numpy array with 81 numbers per game, as lists of rows, or in the
+        81-character line format.
+    :return: a numpy array of shape (number of games, 81) and type uint8, where 0 means a blank cell.
+    """
+    if np is None:
+        raise ImportError("numpy is required to work on batches of games")
+    if isinstance(games, np.ndarray):
+        return games.reshape(-1, 81).astype(np.uint8)
+    games = list(games)
+    if games and isinstance(games[0], (bytes, bytearray, memoryview, str)):
+        lines = b"".join(bytes(game[:81], "ascii") if isinstance(game, str) else bytes(game[:81]) for game in games)
+        return np.array(BYTE_VALUE, dtype=np.uint8)[np.frombuffer(lines, dtype=np.uint8)].reshape(-1, 81)
+    return np.array(games, dtype=np.uint8).reshape(-1, 81)
+
+
+def batch_candidates(boards):
+    """
+    Compute the candidate masks of all the cells of a batch of Sudoku games at once, same as the masks of the "bitmask"
+    and "propagate" solvers.
+
+    :param boards: a numpy array of shape (number of games, 81) from batch_array().
+    :return: a numpy array of shape (number of games, 81) and type uint16 with the candidates of each cell, 0 once
+        filled.
+    """
+    used = np.array([0] + [1 << d for d in range(9)], dtype=np.uint16)[boards]
+    row = np.bitwise_or.reduce(used.reshape(-1, 9, 9), axis=2)
+    col = np.bitwise_or.reduce(used.reshape(-1, 9, 9), axis=1)
+    block = np.bitwise_or.reduce(used.reshape(-1, 3, 3, 3, 3), axis=(2, 4)).reshape(-1, 9)
+    used = row[:, ROW] | col[:, COL] | block[:, BOX]
+    return np.where(boards == 0, 511 & ~used, 0).astype(np.uint16)
+
+
+def batch_valid(boards, complete=False):
+    """
+    Check a batch of Sudoku games at once for any number used twice in a row, column or block.
+
+    :param boards: a numpy array of shape (number of games, 81) from batch_array().
+    :param complete: (optional) Also require all the cells to be filled, i.e. check for solved games. The default is
+        not to require it.
+    :return: a numpy array of booleans, one per game.
+    """
+    # A unit has no number used twice if its filled cells cover as many numbers as there are of them.
+    used = np.bitwise_or.reduce(np.array([0] + [1 << d for d in range(9)], dtype=np.uint16)[boards][:, UNITS], axis=2)
+    valid = (np.array(POPCOUNT, dtype=np.uint8)[used] == (boards[:, UNITS] != 0).sum(axis=2)).all(axis=1)
+    if complete:
+        valid &= (boards != 0).all(axis=1)
+    return valid
+
+
+def batch_singles(boards):
+    """
+    Fill the naked singles and hidden singles of a batch of Sudoku games at once, round after round until none is left.
+    In each round, every single found in the current candidates is filled at the same time. A game is left alone as
+    soon as it is found to be invalid.
+
+    :param boards: a numpy array of shape (number of games, 81) from batch_array(). It is not changed.
+    :return: a list with the filled numpy array and a numpy array of booleans telling which games are still valid.
+    """
+    boards = boards.copy()
+    valid = batch_valid(boards)
+    units = np.array(UNITS)
+    popcount = np.array(POPCOUNT, dtype=np.uint8)
+    lowbit = np.array(LOWBIT, dtype=np.uint8)
+    while True:
+        cand = batch_candidates(boards)
+        valid &= ~((boards == 0) & (cand == 0)).any(axis=1)
+        cand[~valid] = 0
+
+        # Naked singles.
+        naked = popcount[cand] == 1
+        boards[naked] = lowbit[cand[naked]]
+
+        # Hidden singles, same as the "propagate" solver: "once" and "twice" collect the numbers that fit at least one
+        # and two cells of each unit.
+        fits = cand[:, units]
+        once = np.zeros(fits.shape[:2], dtype=np.uint16)
+        twice = np.zeros(fits.shape[:2], dtype=np.uint16)
+        for k in range(9):
+            twice |= once & fits[:, :, k]
+            once |= fits[:, :, k]
+        fits &= (once & ~twice)[:, :, None]
+        game, unit, k = np.nonzero(fits)
+        boards[game, units[unit, k]] = lowbit[fits[game, unit, k]]
+
+        if not naked.any() and not len(game):
+            return [boards, valid]
+        valid &= batch_valid(boards)
+
+
+def solve_batch(games, method="propagate", random_state=None):
+    """
+    Solve a batch of Sudoku games, filling the singles of all of them at once with numpy first. Only the games that
+    are still not solved after that are passed on to Sudoku.solver() one by one.
+
+    :param games: Sudoku grids in any format accepted by batch_array().
+    :param method: (optional) Solver method to use for the games left, same as Sudoku.solver(). The default is
+        "propagate".
+    :param random_state: (optional) a user-defined random seed to generate reproducible results.
+    :return: a list with a numpy array of shape (number of games, 81) with the solved games, and a numpy array of
+        booleans telling which games were solved. A game that cannot be solved is left as it is.
+    """
+    games = batch_array(games)
+    boards, valid = batch_singles(games)
+    solved = valid & (boards != 0).all(axis=1)
+    sudoku = Sudoku(random_state=random_state)
+    for n in np.nonzero(valid & ~solved)[0]:
+        res = sudoku.solver(array=(boards[n] + 48).tobytes(), method=method, verbose=False)
+        if res[0][0]:
+            boards[n] = np.frombuffer(res[1], dtype=np.uint8) - 48
+            solved[n] = True
+    boards[~solved] = games[~solved]
+    return [boards, solved]